@@ -8,10 +8,12 @@ the initial configuration of the Church Stream Sync system.
 from __future__ import annotations
 
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -30,17 +32,17 @@ from PyQt5.QtWidgets import (
 
 from src.core import logger
 from src.core.config import AudioPCConfig, NetworkConfig, UIConfig, get_config
-from src.core.network import NetworkChecker
 from src.core.validators import (
     normalize_mac,
     validate_ip,
     validate_mac,
     validate_username,
 )
-from src.utils.windows import WindowsTaskManager
 
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from src.core.config import Config
 
 
@@ -57,17 +59,30 @@ class TestConnectionThread(QThread):
 
     def run(self) -> None:
         """Test connection to the Audio PC."""
+        from src.core.network import NetworkChecker
+
+        # Fast probe first (LAN round-trips are a few ms), full timeout on failure
+        def ping() -> tuple[bool, float | None]:
+            result = NetworkChecker.ping(self.ip, 300)
+            return result if result[0] else NetworkChecker.ping(self.ip, 2000)
+
+        def check_winrm() -> bool:
+            if NetworkChecker.check_port(self.ip, 5985, 500):
+                return True
+            return NetworkChecker.check_port(self.ip, 5985, 3000)
+
         try:
-            # Test ping
-            pingable, latency = NetworkChecker.ping(self.ip, 2000)
+            # Test ping and PowerShell Remoting (port 5985) concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                ping_future = executor.submit(ping)
+                port_future = executor.submit(check_winrm)
+                pingable, latency = ping_future.result()
+                port_open = port_future.result()
 
             if not pingable:
                 self.finished_signal.emit(False, "PC de Áudio não responde a ping")
                 return
 
-            # Test PowerShell Remoting (port 5985)
-            port_open = NetworkChecker.check_port(self.ip, 5985, 3000)
-
             if not port_open:
                 self.finished_signal.emit(False, "Porta WinRM (5985) não está aberta")
                 return
@@ -81,6 +96,21 @@ class TestConnectionThread(QThread):
 class WelcomePage(QWizardPage):
     """Welcome page."""
 
+    _WELCOME_HTML = (
+        "<h3>O que este sistema faz?</h3>"
+        "<p>Sincroniza automaticamente dois computadores usados na transmissão ao vivo:</p>"
+        "<ul>"
+        "<li><b>PC OBS:</b> Computador principal (onde está o OBS Studio)</li>"
+        "<li><b>PC de Áudio:</b> Computador conectado à mesa de som</li>"
+        "</ul>"
+        "<p><b>Como funciona:</b></p>"
+        "<ul>"
+        "<li>Ao ligar o PC OBS → PC de Áudio liga automaticamente</li>"
+        "<li>Ao desligar o PC OBS → PC de Áudio desliga junto</li>"
+        "</ul>"
+        "<p>Clique em 'Próximo' para começar a configuração.</p>"
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self.setTitle("Bem-vindo ao Church Stream Sync")
@@ -92,20 +122,7 @@ class WelcomePage(QWizardPage):
         layout = QVBoxLayout()
 
         # Explanatory text
-        info_text = QLabel(
-            "<h3>O que este sistema faz?</h3>"
-            "<p>Sincroniza automaticamente dois computadores usados na transmissão ao vivo:</p>"
-            "<ul>"
-            "<li><b>PC OBS:</b> Computador principal (onde está o OBS Studio)</li>"
-            "<li><b>PC de Áudio:</b> Computador conectado à mesa de som</li>"
-            "</ul>"
-            "<p><b>Como funciona:</b></p>"
-            "<ul>"
-            "<li>Ao ligar o PC OBS → PC de Áudio liga automaticamente</li>"
-            "<li>Ao desligar o PC OBS → PC de Áudio desliga junto</li>"
-            "</ul>"
-            "<p>Clique em 'Próximo' para começar a configuração.</p>"
-        )
+        info_text = QLabel(self._WELCOME_HTML)
         info_text.setWordWrap(True)
         layout.addWidget(info_text)
 
@@ -116,11 +133,35 @@ class WelcomePage(QWizardPage):
 class AudioPCConfigPage(QWizardPage):
     """Audio PC configuration page."""
 
+    _MAC_HELP_TEXT = (
+        "Para encontrar o MAC Address no PC de Áudio:\n\n"
+        "1. Abra o Prompt de Comando (cmd)\n"
+        "2. Digite: ipconfig /all\n"
+        "3. Procure por 'Endereço Físico' na placa de rede ativa\n"
+        "4. O formato será algo como: 00-1A-2B-3C-4D-5E\n\n"
+        "Ou use o PowerShell:\n"
+        "Get-NetAdapter | Select-Object Name, MacAddress"
+    )
+
+    # Successful connection tests are reused for this long (seconds)
+    TEST_CACHE_TTL = 30.0
+    # Repeated clicks within this window (ms) coalesce into a single probe
+    TEST_DEBOUNCE_MS = 500
+
+    # (ip, username) -> (timestamp, success, message)
+    _result_cache: ClassVar[dict[tuple[str, str], tuple[float, bool, str]]] = {}
+
     def __init__(self) -> None:
         super().__init__()
         self.setTitle("Configuração do PC de Áudio")
         self.setSubTitle("Insira as informações do computador conectado à mesa de som.")
         self.test_thread: TestConnectionThread | None = None
+        self._pending_test: tuple[str, str, str] | None = None
+        self._test_key: tuple[str, str] | None = None
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._start_test_thread)
 
         layout = QFormLayout()
 
@@ -168,53 +209,48 @@ class AudioPCConfigPage(QWizardPage):
         self.setLayout(layout)
 
         # Register fields (* = required)
-        self.registerField("audio_pc_name", self.name_edit)  # Optional (has default)
-        self.registerField("audio_pc_ip*", self.ip_edit)
-        self.registerField("audio_pc_mac*", self.mac_edit)
-        self.registerField("audio_pc_username*", self.username_edit)
-        self.registerField("audio_pc_password", self.password_edit)  # Optional
+        fields = (
+            ("audio_pc_name", self.name_edit),  # Optional (has default)
+            ("audio_pc_ip*", self.ip_edit),
+            ("audio_pc_mac*", self.mac_edit),
+            ("audio_pc_username*", self.username_edit),
+            ("audio_pc_password", self.password_edit),  # Optional
+        )
+        for name, widget in fields:
+            self.registerField(name, widget)
 
     def validatePage(self) -> bool:
         """Validate fields before advancing."""
+        errors: list[str] = []
+
         # Validate IP
         if not validate_ip(self.ip_edit.text()):
-            QMessageBox.warning(
-                self, "IP Inválido", "Por favor, insira um endereço IP válido."
-            )
-            return False
+            errors.append("• Por favor, insira um endereço IP válido.")
 
         # Validate MAC
         if not validate_mac(self.mac_edit.text()):
-            QMessageBox.warning(
-                self,
-                "MAC Inválido",
-                "Por favor, insira um endereço MAC válido.\n"
-                "Formatos aceitos: XX-XX-XX-XX-XX-XX ou XX:XX:XX:XX:XX:XX",
+            errors.append(
+                "• Por favor, insira um endereço MAC válido.\n"
+                "  Formatos aceitos: XX-XX-XX-XX-XX-XX ou XX:XX:XX:XX:XX:XX"
             )
-            return False
 
         # Validate username
         valid, error_msg = validate_username(self.username_edit.text())
         if not valid:
-            QMessageBox.warning(self, "Usuário Inválido", error_msg)
+            errors.append(f"• {error_msg}")
+
+        if errors:
+            QMessageBox.warning(self, "Campos Inválidos", "\n\n".join(errors))
             return False
 
         return True
 
     def _show_mac_help(self) -> None:
         """Show help for finding MAC address."""
-        help_text = (
-            "Para encontrar o MAC Address no PC de Áudio:\n\n"
-            "1. Abra o Prompt de Comando (cmd)\n"
-            "2. Digite: ipconfig /all\n"
-            "3. Procure por 'Endereço Físico' na placa de rede ativa\n"
-            "4. O formato será algo como: 00-1A-2B-3C-4D-5E\n\n"
-            "Ou use o PowerShell:\n"
-            "Get-NetAdapter | Select-Object Name, MacAddress"
+        QMessageBox.information(
+            self, "Como Encontrar o MAC Address", self._MAC_HELP_TEXT
         )
 
-        QMessageBox.information(self, "Como Encontrar o MAC Address", help_text)
-
     def _test_connection(self) -> None:
         """Test connection to the Audio PC."""
         ip = self.ip_edit.text()
@@ -229,17 +265,44 @@ class AudioPCConfigPage(QWizardPage):
             )
             return
 
-        self.test_button.setEnabled(False)
+        # Reuse a recent successful result for the same target
+        cached = self._result_cache.get((ip, username))
+        if cached and time.monotonic() - cached[0] < self.TEST_CACHE_TTL:
+            _, success, message = cached
+            QTimer.singleShot(0, lambda: self._on_test_finished(success, message))
+            return
+
         self.test_result.setText("Testando...")
 
+        # (Re)start debounce: the last click within the window wins
+        self._pending_test = (ip, username, password)
+        self._debounce_timer.start(self.TEST_DEBOUNCE_MS)
+
+    def _start_test_thread(self) -> None:
+        """Start the connection test thread after the debounce window."""
+        if self._pending_test is None:
+            return
+
+        ip, username, password = self._pending_test
+        self._pending_test = None
+        self._test_key = (ip, username)
+
+        self.test_button.setEnabled(False)
+
         self.test_thread = TestConnectionThread(ip, username, password)
-        self.test_thread.finished_signal.connect(self._on_test_finished)
+        self.test_thread.finished_signal.connect(
+            self._on_test_finished, Qt.QueuedConnection
+        )
         self.test_thread.start()
 
     def _on_test_finished(self, success: bool, message: str) -> None:
         """Callback for connection test."""
         self.test_button.setEnabled(True)
 
+        if success and self._test_key is not None:
+            self._result_cache[self._test_key] = (time.monotonic(), success, message)
+        self._test_key = None
+
         if success:
             self.test_result.setText(f"✅ {message}")
             self.test_result.setStyleSheet("color: green;")
@@ -304,6 +367,20 @@ class AdvancedConfigPage(QWizardPage):
 class SummaryPage(QWizardPage):
     """Summary and confirmation page."""
 
+    _TEMPLATE = (
+        "<h3>Configurações:</h3>"
+        "<table cellpadding='5'>"
+        "<tr><td><b>PC de Áudio:</b></td><td>{name}</td></tr>"
+        "<tr><td><b>IP:</b></td><td>{ip}</td></tr>"
+        "<tr><td><b>MAC:</b></td><td>{mac}</td></tr>"
+        "<tr><td><b>Usuário:</b></td><td>{username}</td></tr>"
+        "<tr><td><b>Max Tentativas:</b></td><td>{max_retries}</td></tr>"
+        "<tr><td><b>Intervalo:</b></td><td>{retry_interval}s</td></tr>"
+        "<tr><td><b>Janela Inicial:</b></td><td>{show_startup}</td></tr>"
+        "<tr><td><b>Notificações:</b></td><td>{show_notifications}</td></tr>"
+        "</table>"
+    )
+
     def __init__(self) -> None:
         super().__init__()
         self.setTitle("Resumo da Configuração")
@@ -315,26 +392,29 @@ class SummaryPage(QWizardPage):
         self.summary_text.setReadOnly(True)
         layout.addWidget(self.summary_text)
 
+        self._last_values: dict[str, object] | None = None
+
         self.setLayout(layout)
 
     def initializePage(self) -> None:
         """Update summary when page is displayed."""
-        mac_normalized = normalize_mac(str(self.field("audio_pc_mac")))
-        summary = "<h3>Configurações:</h3>"
-        summary += "<table cellpadding='5'>"
-        summary += f"<tr><td><b>PC de Áudio:</b></td><td>{self.field('audio_pc_name')}</td></tr>"
-        summary += f"<tr><td><b>IP:</b></td><td>{self.field('audio_pc_ip')}</td></tr>"
-        summary += f"<tr><td><b>MAC:</b></td><td>{mac_normalized}</td></tr>"
-        summary += f"<tr><td><b>Usuário:</b></td><td>{self.field('audio_pc_username')}</td></tr>"
-        summary += f"<tr><td><b>Max Tentativas:</b></td><td>{self.field('max_retries')}</td></tr>"
-        summary += f"<tr><td><b>Intervalo:</b></td><td>{self.field('retry_interval')}s</td></tr>"
-        show_startup = "Sim" if self.field("show_startup") else "Não"
-        show_notif = "Sim" if self.field("show_notifications") else "Não"
-        summary += f"<tr><td><b>Janela Inicial:</b></td><td>{show_startup}</td></tr>"
-        summary += f"<tr><td><b>Notificações:</b></td><td>{show_notif}</td></tr>"
-        summary += "</table>"
-
-        self.summary_text.setHtml(summary)
+        values = {
+            "name": self.field("audio_pc_name"),
+            "ip": self.field("audio_pc_ip"),
+            "mac": normalize_mac(str(self.field("audio_pc_mac"))),
+            "username": self.field("audio_pc_username"),
+            "max_retries": self.field("max_retries"),
+            "retry_interval": self.field("retry_interval"),
+            "show_startup": "Sim" if self.field("show_startup") else "Não",
+            "show_notifications": "Sim" if self.field("show_notifications") else "Não",
+        }
+
+        # Skip the document rebuild when navigating Back/Next without changes
+        if values == self._last_values:
+            return
+        self._last_values = values
+
+        self.summary_text.setHtml(self._TEMPLATE.format(**values))
 
 
 class SetupWizard(QWizard):
@@ -387,13 +467,23 @@ class SetupWizard(QWizard):
                 show_notifications=bool(self.field("show_notifications")),
             )
 
-            # Save
-            if config.save():
+            # Register the startup task while the configuration is written
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                task_future = executor.submit(self._create_startup_task)
+                saved = config.save()
+
+            if saved:
                 logger.info("Configuration saved successfully")
 
-                # Create scheduled tasks (startup and shutdown)
-                self._create_scheduled_tasks()
+                # Report scheduled task status
+                self._create_scheduled_tasks(task_future)
             else:
+                # Don't leave a logon task behind without a configuration
+                from src.utils.windows import WindowsTaskManager
+
+                if task_future.result()[0]:
+                    WindowsTaskManager.remove_tasks()
+
                 QMessageBox.critical(
                     self, "Erro", "Não foi possível salvar a configuração."
                 )
@@ -402,27 +492,49 @@ class SetupWizard(QWizard):
             logger.exception("Error saving configuration")
             QMessageBox.critical(self, "Erro", f"Erro ao salvar configuração:\n{e!s}")
 
-    def _create_scheduled_tasks(self) -> None:
-        """Create Windows scheduled task for startup."""
+    @staticmethod
+    def _create_startup_task() -> tuple[bool, str]:
+        """Create the Windows scheduled task for startup."""
+        from src.utils.windows import WindowsTaskManager
+
+        # Determine executable path
+        exe_path = Path(sys.executable)
+
+        if exe_path.name.lower() == "python.exe":
+            # In development - use Python scripts
+            base_path = Path(__file__).parent.parent
+            startup_exe = f'"{sys.executable}" "{base_path / "src" / "main.py"}"'
+        elif exe_path.stem == "ChurchStreamSync":
+            # Running inside the main application (reconfiguration)
+            startup_exe = str(exe_path)
+        else:
+            # Compiled installer - main application is a folder next to it
+            base_path = exe_path.parent
+            startup_exe = str(base_path / "ChurchStreamSync" / "ChurchStreamSync.exe")
+
+            if not Path(startup_exe).is_file():
+                logger.error("Main application not found: %s", startup_exe)
+                return False, (
+                    f"Aplicativo principal não encontrado:\n{startup_exe}\n\n"
+                    "Extraia ChurchStreamSync.zip na mesma pasta do ChurchSetup.exe."
+                )
 
-        try:
-            # Determine executable path
-            exe_path = Path(sys.executable)
+        logger.info("Creating startup task...")
+        return WindowsTaskManager.create_startup_task(startup_exe)
 
-            if exe_path.name.lower() == "python.exe":
-                # In development - use Python scripts
-                base_path = Path(__file__).parent.parent
-                startup_exe = f'"{sys.executable}" "{base_path / "src" / "main.py"}"'
-            else:
-                # Compiled executable
-                base_path = exe_path.parent
-                startup_exe = str(base_path / "ChurchStreamSync.exe")
+    def _create_scheduled_tasks(self, task_future: Future[tuple[bool, str]]) -> None:
+        """
+        Verify the startup task and report the result to the user.
 
+        Args:
+            task_future: Pending result of _create_startup_task
+        """
+        from src.utils.windows import WindowsTaskManager
+
+        try:
             messages = []
 
-            # Create startup task
-            logger.info("Creating startup task...")
-            success, msg = WindowsTaskManager.create_startup_task(startup_exe)
+            success, msg = task_future.result()
             if success:
                 messages.append("✓ Inicialização automática configurada")
             else:
@@ -431,7 +543,7 @@ class SetupWizard(QWizard):
             # Check task status
             status = WindowsTaskManager.check_tasks()
 
-            if status["startup"]:
+            if success and status["startup"]:
                 logger.info("Startup task created successfully")
                 QMessageBox.information(
                     self,
@@ -482,7 +594,7 @@ def run_setup_wizard() -> bool:
 
 def main() -> None:
     """Main function for the installer."""
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
     app.setStyle("Fusion")
 
     wizard = SetupWizard()
@@ -7,10 +7,11 @@ configuration files, and logs created by the system.
 
 from __future__ import annotations
 
-import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QApplication,
@@ -27,6 +28,108 @@ from src.core.config import Config
 from src.utils.windows import WindowsTaskManager
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from PyQt5.QtGui import QCloseEvent
+
+
+class UninstallWorker(QThread):
+    """Thread to run the removal steps without blocking the UI."""
+
+    progress = pyqtSignal(str)  # log line
+    finished_signal = pyqtSignal(list)  # summary lines
+
+    def __init__(
+        self, remove_tasks: bool, remove_config: bool, remove_logs: bool
+    ) -> None:
+        super().__init__()
+        self.remove_tasks = remove_tasks
+        self.remove_config = remove_config
+        self.remove_logs = remove_logs
+
+    def run(self) -> None:
+        """Execute the selected removal steps."""
+        config = Config()
+        results: list[str] = []
+
+        # Remove scheduled tasks
+        if self.remove_tasks:
+            self.progress.emit("Removendo tarefas agendadas...")
+
+            success, msg = WindowsTaskManager.remove_tasks()
+
+            if success:
+                results.append("✓ Tarefas removidas")
+                self.progress.emit(f"  ✓ {msg}")
+            else:
+                results.append("✗ Erro ao remover tarefas")
+                self.progress.emit(f"  ✗ {msg}")
+
+        # Remove configuration
+        if self.remove_config:
+            self.progress.emit("\nRemovendo configurações...")
+
+            try:
+                if config.CONFIG_FILE.exists():
+                    config.CONFIG_FILE.unlink()
+                    results.append("✓ Configurações removidas")
+                    self.progress.emit("  ✓ Configurações removidas")
+                else:
+                    results.append("ℹ Configurações não encontradas")
+                    self.progress.emit("  ℹ Nenhuma configuração encontrada")
+            except Exception as e:
+                results.append(f"✗ Erro ao remover configurações: {e}")
+                self.progress.emit(f"  ✗ Erro: {e}")
+
+        # Remove logs
+        if self.remove_logs:
+            self.progress.emit("\nRemovendo logs...")
+
+            try:
+                if config.log_dir.exists():
+                    self._remove_directory(config.log_dir)
+                    results.append("✓ Logs removidos")
+                    self.progress.emit("  ✓ Logs removidos")
+                else:
+                    results.append("ℹ Logs não encontrados")
+                    self.progress.emit("  ℹ Nenhum log encontrado")
+            except Exception as e:
+                results.append(f"✗ Erro ao remover logs: {e}")
+                self.progress.emit(f"  ✗ Erro: {e}")
+
+        # Try to remove config folder if empty
+        try:
+            if config.CONFIG_DIR.exists() and not any(config.CONFIG_DIR.iterdir()):
+                config.CONFIG_DIR.rmdir()
+                self.progress.emit("\n  ✓ Pasta de configuração removida")
+        except Exception:
+            pass
+
+        self.finished_signal.emit(results)
+
+    @staticmethod
+    def _remove_directory(path: Path) -> None:
+        """
+        Remove a directory tree, unlinking its files in parallel.
+
+        Args:
+            path: Directory to remove
+        """
+        entries = list(path.rglob("*"))
+        files = [entry for entry in entries if not entry.is_dir()]
+        dirs = [entry for entry in entries if entry.is_dir()]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Consume the iterator so the first unlink error is re-raised
+            list(executor.map(lambda file: file.unlink(missing_ok=True), files))
+
+        # Deepest directories first
+        for directory in sorted(dirs, key=lambda d: len(d.parts), reverse=True):
+            directory.rmdir()
+        path.rmdir()
+
+
 class UninstallDialog(QDialog):
     """Uninstall dialog."""
 
@@ -35,6 +138,8 @@ class UninstallDialog(QDialog):
         self.setWindowTitle("Desinstalar Church Stream Sync")
         self.setFixedSize(500, 400)
 
+        self.worker: UninstallWorker | None = None
+
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -143,68 +248,38 @@ class UninstallDialog(QDialog):
         self.result_text.show()
         self.result_text.clear()
         self.uninstall_button.setEnabled(False)
+        self.close_button.setEnabled(False)
 
-        results = []
-
-        # Remove scheduled tasks
-        if self.remove_tasks.isChecked():
-            self.result_text.append("Removendo tarefas agendadas...")
-            QApplication.processEvents()
-
-            success, msg = WindowsTaskManager.remove_tasks()
-
-            if success:
-                results.append("✓ Tarefas removidas")
-                self.result_text.append(f"  ✓ {msg}")
-            else:
-                results.append("✗ Erro ao remover tarefas")
-                self.result_text.append(f"  ✗ {msg}")
-
-        # Remove configuration
-        if self.remove_config.isChecked():
-            self.result_text.append("\nRemovendo configurações...")
-            QApplication.processEvents()
-
-            try:
-                config = Config()
-                if config.CONFIG_FILE.exists():
-                    config.CONFIG_FILE.unlink()
-                    results.append("✓ Configurações removidas")
-                    self.result_text.append("  ✓ Configurações removidas")
-                else:
-                    results.append("ℹ Configurações não encontradas")
-                    self.result_text.append("  ℹ Nenhuma configuração encontrada")
-            except Exception as e:
-                results.append(f"✗ Erro ao remover configurações: {e}")
-                self.result_text.append(f"  ✗ Erro: {e}")
+        self.worker = UninstallWorker(
+            remove_tasks=self.remove_tasks.isChecked(),
+            remove_config=self.remove_config.isChecked(),
+            remove_logs=self.remove_logs.isChecked(),
+        )
+        self.worker.progress.connect(self.result_text.append, Qt.QueuedConnection)
+        self.worker.finished_signal.connect(
+            self._on_uninstall_finished, Qt.QueuedConnection
+        )
+        self.worker.start()
 
-        # Remove logs
-        if self.remove_logs.isChecked():
-            self.result_text.append("\nRemovendo logs...")
-            QApplication.processEvents()
+    def _is_running(self) -> bool:
+        """Whether the uninstall worker is still removing files."""
+        return self.worker is not None and self.worker.isRunning()
 
-            try:
-                config = Config()
-                if config.log_dir.exists():
-                    shutil.rmtree(config.log_dir)
-                    results.append("✓ Logs removidos")
-                    self.result_text.append("  ✓ Logs removidos")
-                else:
-                    results.append("ℹ Logs não encontrados")
-                    self.result_text.append("  ℹ Nenhum log encontrado")
-            except Exception as e:
-                results.append(f"✗ Erro ao remover logs: {e}")
-                self.result_text.append(f"  ✗ Erro: {e}")
+    def reject(self) -> None:
+        """Ignore Esc/Cancel while the uninstall is in progress."""
+        if self._is_running():
+            return
+        super().reject()
 
-        # Try to remove config folder if empty
-        try:
-            config = Config()
-            if config.CONFIG_DIR.exists() and not any(config.CONFIG_DIR.iterdir()):
-                config.CONFIG_DIR.rmdir()
-                self.result_text.append("\n  ✓ Pasta de configuração removida")
-        except Exception:
-            pass
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Keep the dialog open until the uninstall worker finishes."""
+        if self._is_running():
+            event.ignore()
+            return
+        super().closeEvent(event)
 
+    def _on_uninstall_finished(self, results: list[str]) -> None:
+        """Callback for uninstall worker completion."""
         # Show final result
         self.result_text.append("\n" + "=" * 50)
         self.result_text.append("\nDesinstalação concluída!")
@@ -213,6 +288,7 @@ class UninstallDialog(QDialog):
 
         # Update buttons
         self.uninstall_button.hide()
+        self.close_button.setEnabled(True)
         self.close_button.setText("Fechar")
 
         # Final message
@@ -229,7 +305,7 @@ class UninstallDialog(QDialog):
 
 def main() -> None:
     """Main function for the uninstaller."""
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
     app.setStyle("Fusion")
 
     dialog = UninstallDialog()
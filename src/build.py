@@ -7,11 +7,14 @@ into standalone Windows executables.
 
 from __future__ import annotations
 
+import argparse
+import os
 import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import PyInstaller.__main__
-
 
 # Directories
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -21,10 +24,25 @@ BUILD_DIR = PROJECT_ROOT / "build"
 RESOURCES_DIR = PROJECT_ROOT / "resources"
 
 
-def clean_build_dirs() -> None:
-    """Clean previous build directories."""
+def clean_build_dirs(targets: list[str] | None = None) -> None:
+    """
+    Clean previous build output.
+
+    Args:
+        targets: Executable names to remove from DIST_DIR. BUILD_DIR is kept
+            so PyInstaller can reuse its analysis cache. When None (--fresh),
+            both directories are removed entirely.
+    """
     print("Cleaning build directories...")
 
+    if targets is not None:
+        DIST_DIR.mkdir(exist_ok=True)
+        for target in targets:
+            (DIST_DIR / f"{target}.exe").unlink(missing_ok=True)
+            if (DIST_DIR / target).is_dir():
+                shutil.rmtree(DIST_DIR / target)
+        return
+
     if DIST_DIR.exists():
         shutil.rmtree(DIST_DIR)
 
@@ -34,103 +52,119 @@ def clean_build_dirs() -> None:
     DIST_DIR.mkdir(exist_ok=True)
 
 
-def build_main_app() -> None:
-    """Compile the main application (Wake on LAN)."""
-    print("\n" + "=" * 60)
-    print("Compiling ChurchStreamSync.exe...")
-    print("=" * 60)
+# Hidden imports shared by every Qt executable
+QT_HIDDEN_IMPORTS = ["PyQt5", "PyQt5.QtCore", "PyQt5.QtGui", "PyQt5.QtWidgets"]
+
 
+def _common_args(
+    name: str,
+    script: Path,
+    hidden_imports: list[str],
+    fresh: bool = False,
+    onefile: bool = True,
+) -> list[str]:
+    """
+    Build the PyInstaller arguments shared by all executables.
+
+    Args:
+        name: Executable name (without extension)
+        script: Entry point script
+        hidden_imports: Modules PyInstaller cannot detect on its own
+        fresh: Discard the PyInstaller cache before building
+        onefile: Bundle into a single exe; otherwise build a folder, which
+            starts faster because nothing is extracted on launch
+
+    Returns:
+        PyInstaller command-line arguments
+    """
     args = [
-        str(SRC_DIR / "main.py"),
-        "--name=ChurchStreamSync",
-        "--onefile",
+        str(script),
+        f"--name={name}",
+        "--onefile" if onefile else "--onedir",
         "--windowed",
         f"--distpath={DIST_DIR}",
-        f"--workpath={BUILD_DIR}",
-        "--clean",
+        f"--workpath={BUILD_DIR / name}",
         "--noupx",
+        # Strip asserts and docstrings from the bundled bytecode
+        "--optimize=2",
         # Icon (if exists)
         # f"--icon={RESOURCES_DIR / 'icons' / 'app.ico'}",
         # Additional data
         "--add-data=src;src",
         # Hooks and hidden imports
-        "--hidden-import=PyQt5",
-        "--hidden-import=PyQt5.QtCore",
-        "--hidden-import=PyQt5.QtGui",
-        "--hidden-import=PyQt5.QtWidgets",
-        "--hidden-import=wmi",
-        "--hidden-import=win32api",
-        "--hidden-import=win32com",
+        *(f"--hidden-import={module}" for module in hidden_imports),
         # Settings
         "--noconfirm",
     ]
 
-    PyInstaller.__main__.run(args)
-    print("\n[OK] ChurchStreamSync.exe compiled successfully!")
+    if fresh:
+        args.append("--clean")
+
+    return args
+
+
+def build_main_app(fresh: bool = False) -> list[str]:
+    """Return PyInstaller arguments for the main application (Wake on LAN)."""
+    hidden_imports = [*QT_HIDDEN_IMPORTS, "win32api", "win32com", "win32com.client"]
+    # Launched on every login: ship as a folder to skip onefile extraction
+    return _common_args(
+        "ChurchStreamSync", SRC_DIR / "main.py", hidden_imports, fresh, onefile=False
+    )
 
 
 # Note: ChurchShutdown.exe is no longer needed as shutdown is handled
 # by the background service intercepting Windows shutdown events
 
 
-def build_installer() -> None:
-    """Compile the installer."""
-    print("\n" + "=" * 60)
-    print("Compiling ChurchSetup.exe...")
-    print("=" * 60)
+def build_installer(fresh: bool = False) -> list[str]:
+    """Return PyInstaller arguments for the installer."""
+    script = PROJECT_ROOT / "installer" / "setup.py"
+    return _common_args("ChurchSetup", script, QT_HIDDEN_IMPORTS, fresh)
 
-    args = [
-        str(PROJECT_ROOT / "installer" / "setup.py"),
-        "--name=ChurchSetup",
-        "--onefile",
-        "--windowed",
-        f"--distpath={DIST_DIR}",
-        f"--workpath={BUILD_DIR}",
-        "--clean",
-        "--noupx",
-        # Additional data
-        "--add-data=src;src",
-        # Hooks and hidden imports
-        "--hidden-import=PyQt5",
-        "--hidden-import=PyQt5.QtCore",
-        "--hidden-import=PyQt5.QtGui",
-        "--hidden-import=PyQt5.QtWidgets",
-        # Settings
-        "--noconfirm",
-    ]
 
-    PyInstaller.__main__.run(args)
-    print("\n[OK] ChurchSetup.exe compiled successfully!")
+def build_uninstaller(fresh: bool = False) -> list[str]:
+    """Return PyInstaller arguments for the uninstaller."""
+    script = PROJECT_ROOT / "installer" / "uninstall.py"
+    return _common_args("ChurchUninstall", script, QT_HIDDEN_IMPORTS, fresh)
 
 
-def build_uninstaller() -> None:
-    """Compile the uninstaller."""
-    print("\n" + "=" * 60)
-    print("Compiling ChurchUninstall.exe...")
-    print("=" * 60)
+def run_pyinstaller(name: str, args: list[str]) -> bool:
+    """
+    Compile one executable in a separate PyInstaller process.
 
-    args = [
-        str(PROJECT_ROOT / "installer" / "uninstall.py"),
-        "--name=ChurchUninstall",
-        "--onefile",
-        "--windowed",
-        f"--distpath={DIST_DIR}",
-        f"--workpath={BUILD_DIR}",
-        "--clean",
-        "--noupx",
-        # Additional data
-        "--add-data=src;src",
-        # Hooks and hidden imports
-        "--hidden-import=PyQt5",
-        "--hidden-import=PyQt5.QtCore",
-        "--hidden-import=PyQt5.QtGui",
-        "--hidden-import=PyQt5.QtWidgets",
-        # Settings
-        "--noconfirm",
-    ]
+    Each job gets its own PYINSTALLER_CONFIG_DIR so concurrent builds
+    don't corrupt the shared binary cache.
+
+    Args:
+        name: Executable name (without extension)
+        args: PyInstaller command-line arguments
+
+    Returns:
+        True if compiled successfully
+    """
+    print(f"Compiling {name}.exe...")
+
+    env = os.environ.copy()
+    env["PYINSTALLER_CONFIG_DIR"] = str(BUILD_DIR / f"piconfig_{name}")
+
+    result = subprocess.run(
+        [sys.executable, "-m", "PyInstaller", *args], env=env, check=False
+    )
+
+    if result.returncode != 0:
+        print(f"\n[ERROR] {name}.exe failed to compile")
+        return False
 
-    PyInstaller.__main__.run(args)
-    print("\n[OK] ChurchUninstall.exe compiled successfully!")
+    print(f"\n[OK] {name}.exe compiled successfully!")
+    return True
+
+
+# Executable name -> argument builder
+BUILDS = {
+    "ChurchSetup": build_installer,
+    "ChurchUninstall": build_uninstaller,
+    "ChurchStreamSync": build_main_app,
+}
 
 
 def create_readme() -> None:
@@ -142,7 +176,8 @@ Church Stream Sync - Executables
 FILES:
 ------
 - ChurchSetup.exe     - Run this to configure the system (optional after first setup)
-- ChurchStreamSync.exe - Main application (runs automatically on login)
+- ChurchStreamSync\\ChurchStreamSync.exe - Main application (runs automatically
+  on login). Keep the whole ChurchStreamSync folder next to ChurchSetup.exe.
 - ChurchUninstall.exe  - Uninstaller
 
 HOW IT WORKS:
@@ -183,19 +218,46 @@ For more information, see the full documentation.
     print("\n[OK] README.txt created")
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Main build function."""
+    parser = argparse.ArgumentParser(description="Build Church Stream Sync executables")
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="discard the PyInstaller cache and rebuild from scratch",
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        metavar="TARGET",
+        help=f"executables to build: {', '.join(BUILDS)} (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.targets) - set(BUILDS))
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    targets = args.targets or list(BUILDS)
+
     print("\n" + "=" * 60)
     print("Church Stream Sync - Build System")
     print("=" * 60)
 
-    # Clean directories
-    clean_build_dirs()
+    # Clean directories (only the executables being rebuilt, unless --fresh)
+    clean_build_dirs(None if args.fresh else targets)
+
+    # Compile executables in parallel (independent outputs)
+    jobs = {name: BUILDS[name](fresh=args.fresh) for name in targets}
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        results = dict(
+            zip(jobs, pool.map(run_pyinstaller, jobs, jobs.values()), strict=True)
+        )
 
-    # Compile all executables
-    build_installer()
-    build_uninstaller()
-    build_main_app()
+    failed = [name for name, ok in results.items() if not ok]
+    if failed:
+        print(f"\nBUILD FAILED: {', '.join(failed)}")
+        sys.exit(1)
 
     # Create README
     create_readme()
@@ -206,12 +268,12 @@ def main() -> None:
     print("=" * 60)
     print(f"\nExecutables available at: {DIST_DIR}")
     print("\nGenerated files:")
-    for exe in DIST_DIR.glob("*.exe"):
-        print(f"  - {exe.name}")
+    for exe in [*DIST_DIR.glob("*.exe"), *DIST_DIR.glob("*/*.exe")]:
+        print(f"  - {exe.relative_to(DIST_DIR)}")
 
     print("\n" + "=" * 60)
     print("NEXT STEPS:")
-    print("  1. Copy executables to the OBS PC")
+    print("  1. Copy the contents of dist/ to the OBS PC")
     print("  2. Run ChurchSetup.exe")
     print("  3. Configure the system")
     print("  4. Test with logoff/login")
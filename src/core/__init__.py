@@ -7,16 +7,39 @@ This module contains the core functionality including:
 - Network operations (ping, port checking)
 - Wake-on-LAN implementation
 - Input validation
+
+Submodules are imported on first access so short-lived entry points only
+load what they use.
 """
 
+from __future__ import annotations
+
+import importlib
 import subprocess
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from src.core import config, logger, network, validators, wol
+
 
 # Prevent console window flash on Windows when running subprocess commands.
 # On Windows, CREATE_NO_WINDOW (0x08000000) suppresses the console window.
 # On other platforms, this resolves to 0 (no-op).
 SUBPROCESS_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
-from src.core import config, logger, network, validators, wol
+_SUBMODULES = frozenset({"config", "logger", "network", "validators", "wol"})
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import core submodules lazily (PEP 562)."""
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"src.core.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["SUBPROCESS_FLAGS", "config", "logger", "network", "validators", "wol"]
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict, dataclass, field
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -69,6 +70,9 @@ class Config:
         self.network = NetworkConfig()
         self.ui = UIConfig()
         self.log = LogConfig()
+        self._mtime_ns: int | None = None  # config file mtime when last read
+        self._save_timer: threading.Timer | None = None
+        self._save_lock = threading.Lock()
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -103,6 +107,7 @@ class Config:
                 f"Configuration file not found: {config.CONFIG_FILE}"
             )
 
+        config._mtime_ns = config.CONFIG_FILE.stat().st_mtime_ns
         with config.CONFIG_FILE.open(encoding="utf-8") as f:
             data = json.load(f)
 
@@ -132,6 +137,7 @@ class Config:
             if not self.CONFIG_FILE.exists():
                 return False
 
+            mtime_ns = self.CONFIG_FILE.stat().st_mtime_ns
             with self.CONFIG_FILE.open(encoding="utf-8") as f:
                 data = json.load(f)
 
@@ -148,35 +154,81 @@ class Config:
             if "log" in data:
                 self.log = LogConfig(**data["log"])
 
+            self._mtime_ns = mtime_ns
             return True
 
         except Exception as e:
             print(f"Error loading configuration: {e}")
             return False
 
+    def maybe_reload(self) -> bool:
+        """
+        Reload configuration only if the file changed since it was last read.
+
+        Returns:
+            True if the configuration is up to date (unchanged or reloaded),
+            False if the file could not be read
+        """
+        try:
+            mtime_ns = self.CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            return False
+
+        if mtime_ns == self._mtime_ns:
+            return True
+
+        return self.load_instance()
+
     def save(self) -> bool:
         """
         Save configuration to JSON file.
 
+        The file is written to a temporary sibling and then atomically
+        swapped in, so a crash mid-write never leaves a corrupt config.
+        Any pending save_debounced() write is flushed by this call.
+
         Returns:
             True if saved successfully, False otherwise
         """
-        try:
-            data = {
-                "audio_pc": asdict(self.audio_pc),
-                "network": asdict(self.network),
-                "ui": asdict(self.ui),
-                "log": asdict(self.log),
-            }
+        # Held across the write so a debounced save on the timer thread and
+        # a direct save never share the temporary file
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+
+            try:
+                # Keep it readable: users may edit config.json by hand
+                payload = json.dumps(self.to_dict(), indent=4, ensure_ascii=False)
+
+                tmp_file = self.CONFIG_FILE.with_suffix(".json.tmp")
+                tmp_file.write_text(payload, encoding="utf-8")
+                tmp_file.replace(self.CONFIG_FILE)
+                self._mtime_ns = self.CONFIG_FILE.stat().st_mtime_ns
+
+                return True
+
+            except Exception as e:
+                print(f"Error saving configuration: {e}")
+                return False
 
-            with self.CONFIG_FILE.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+    def save_debounced(self, delay: float = 0.5) -> None:
+        """
+        Schedule a save, coalescing calls made within the delay window.
 
-            return True
+        Use save() when the write must complete before continuing
+        (e.g. on exit), since it flushes any pending debounced save.
 
-        except Exception as e:
-            print(f"Error saving configuration: {e}")
-            return False
+        Args:
+            delay: Seconds to wait for further changes before writing
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+
+            self._save_timer = threading.Timer(delay, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def is_configured(self) -> bool:
         """
@@ -232,11 +284,17 @@ class Config:
         Returns:
             Dictionary representation of configuration
         """
+        # Sections are flat dataclasses, so a shallow copy of each instance
+        # dict matches asdict() without its recursive deep copy. The one
+        # mutable field (check_ports) is copied explicitly.
         return {
-            "audio_pc": asdict(self.audio_pc),
-            "network": asdict(self.network),
-            "ui": asdict(self.ui),
-            "log": asdict(self.log),
+            "audio_pc": vars(self.audio_pc).copy(),
+            "network": {
+                **vars(self.network),
+                "check_ports": list(self.network.check_ports),
+            },
+            "ui": vars(self.ui).copy(),
+            "log": vars(self.log).copy(),
         }
 
 
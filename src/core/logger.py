@@ -1,15 +1,21 @@
 """
 Centralized logging system.
 
-This module provides a singleton Logger class that handles all logging
-for the application with file rotation and optional console output.
+This module configures the application logger once, on first import, with
+file rotation and optional console output. The logging functions below are
+the bound methods of that logger, so each call goes straight to ``logging``.
+
+Records are handed to a queue and written by a background listener thread,
+so callers never block on file I/O.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import TYPE_CHECKING
 
 
@@ -17,130 +23,92 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-class Logger:
-    """System log manager using singleton pattern."""
+_LOG = logging.getLogger("ChurchStreamSync")
+_listener: QueueListener | None = None
 
-    _instance: Logger | None = None
-    _logger: logging.Logger | None = None
 
-    def __new__(cls) -> Logger:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+def _create_handlers() -> list[logging.Handler]:
+    """Create the configured output handlers."""
+    from src.core.config import get_config
 
-    def __init__(self) -> None:
-        if self._logger is not None:
-            return
+    config = get_config()
+    handlers: list[logging.Handler] = []
 
-        self._logger = logging.getLogger("ChurchStreamSync")
-        self._logger.setLevel(logging.DEBUG)
-        self._setup_handlers()
+    # Standard format
+    formatter = logging.Formatter(
+        "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    )
 
-    def _setup_handlers(self) -> None:
-        """Configure log handlers."""
-        from src.core.config import get_config
+    # File handler (rotating)
+    if config.log.enabled:
+        log_file: Path = config.log_dir / f"church_sync_{datetime.now():%Y%m%d}.log"
 
-        config = get_config()
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=config.log.max_size_mb * 1024 * 1024,
+            backupCount=config.log.backup_count,
+            encoding="utf-8",
+        )
+        file_handler.setLevel(getattr(logging, config.log.level))
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
 
-        # Clear existing handlers
-        if self._logger:
-            self._logger.handlers.clear()
+    # Console handler (optional)
+    if config.log.console_output:
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.DEBUG)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
 
-        # Standard format
-        formatter = logging.Formatter(
-            "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
+    return handlers
 
-        # File handler (rotating)
-        if config.log.enabled and self._logger:
-            log_file: Path = config.log_dir / f"church_sync_{datetime.now():%Y%m%d}.log"
-
-            file_handler = RotatingFileHandler(
-                log_file,
-                maxBytes=config.log.max_size_mb * 1024 * 1024,
-                backupCount=config.log.backup_count,
-                encoding="utf-8",
-            )
-            file_handler.setLevel(getattr(logging, config.log.level))
-            file_handler.setFormatter(formatter)
-            self._logger.addHandler(file_handler)
-
-        # Console handler (optional)
-        if config.log.console_output and self._logger:
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.DEBUG)
-            console_handler.setFormatter(formatter)
-            self._logger.addHandler(console_handler)
-
-    def debug(self, message: str) -> None:
-        """Log debug message."""
-        if self._logger:
-            self._logger.debug(message)
-
-    def info(self, message: str) -> None:
-        """Log info message."""
-        if self._logger:
-            self._logger.info(message)
-
-    def warning(self, message: str) -> None:
-        """Log warning message."""
-        if self._logger:
-            self._logger.warning(message)
-
-    def error(self, message: str) -> None:
-        """Log error message."""
-        if self._logger:
-            self._logger.error(message)
-
-    def critical(self, message: str) -> None:
-        """Log critical message."""
-        if self._logger:
-            self._logger.critical(message)
-
-    def exception(self, message: str) -> None:
-        """Log exception with traceback."""
-        if self._logger:
-            self._logger.exception(message)
-
-
-# Global instance
-_logger_instance: Logger | None = None
-
-
-def get_logger() -> Logger:
-    """Return the global logger instance."""
-    global _logger_instance  # noqa: PLW0603
-    if _logger_instance is None:
-        _logger_instance = Logger()
-    return _logger_instance
 
+def _setup_handlers() -> None:
+    """Route the application logger through a queue to its output handlers."""
+    global _listener  # noqa: PLW0603
 
-# Convenience functions
-def debug(message: str) -> None:
-    """Log debug message."""
-    get_logger().debug(message)
+    handlers = _create_handlers()
 
+    if handlers:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _LOG.addHandler(QueueHandler(log_queue))
 
-def info(message: str) -> None:
-    """Log info message."""
-    get_logger().info(message)
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(close)
 
+    # Gate at the logger so records no handler would emit are never created.
+    # Callers pass %-style arguments, so disabled messages are never formatted.
+    _LOG.setLevel(min((h.level for h in handlers), default=logging.WARNING))
 
-def warning(message: str) -> None:
-    """Log warning message."""
-    get_logger().warning(message)
 
+def close() -> None:
+    """
+    Write all pending records and stop the background listener.
 
-def error(message: str) -> None:
-    """Log error message."""
-    get_logger().error(message)
+    Runs automatically at exit; call it explicitly before replacing the
+    process (e.g. os.execl), which skips atexit handlers.
+    """
+    global _listener  # noqa: PLW0603
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
-def critical(message: str) -> None:
-    """Log critical message."""
-    get_logger().critical(message)
+def get_logger() -> logging.Logger:
+    """Return the application logger."""
+    return _LOG
 
 
-def exception(message: str) -> None:
-    """Log exception with traceback."""
-    get_logger().exception(message)
+# Configure once; reuse existing handlers if the module is ever re-imported
+if not _LOG.handlers:
+    _setup_handlers()
+
+
+# Convenience functions
+debug = _LOG.debug
+info = _LOG.info
+warning = _LOG.warning
+error = _LOG.error
+critical = _LOG.critical
+exception = _LOG.exception
@@ -10,16 +10,65 @@ This module provides network-related functionality including:
 
 from __future__ import annotations
 
+import errno
+import itertools
+import os
 import platform
 import re
+import select
 import socket
+import struct
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import ClassVar
 
 from src.core import SUBPROCESS_FLAGS, logger
 
 
-@dataclass
+# connect_ex() results meaning a non-blocking connect is still in progress
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY}
+if hasattr(errno, "WSAEWOULDBLOCK"):
+    _CONNECT_IN_PROGRESS.add(errno.WSAEWOULDBLOCK)
+
+# Ping command parameters, resolved once per process
+_IS_WINDOWS = platform.system().lower() == "windows"
+_PING_PARAMS = ("-n", "-w") if _IS_WINDOWS else ("-c", "-W")
+_LATENCY_RE = re.compile(rb"time[=<](\d+)", re.IGNORECASE)
+
+# ICMP echo (ping) constants
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_DEST_UNREACHABLE = 3
+_ICMP_PAYLOAD = b"ChurchStreamSync"
+_ICMP_HEADER = struct.Struct("!BBHHH")  # type, code, checksum, id, sequence
+_icmp_sequence = itertools.count(1)
+
+# Shared by every get_status call so the port scan can overlap the ping
+# without starting a thread per call
+_status_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="status")
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """
+    Compute the Internet checksum (RFC 1071) of an ICMP message.
+
+    Args:
+        data: ICMP header and payload
+
+    Returns:
+        16-bit one's complement checksum
+    """
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+@dataclass(slots=True)
 class ConnectionStatus:
     """Connection status with the Audio PC."""
 
@@ -48,55 +97,185 @@ class ConnectionStatus:
 class NetworkChecker:
     """Network connectivity checker."""
 
+    # Ping results are reused for this long (seconds)
+    PING_CACHE_TTL = 1.0
+
+    # (host, timeout) -> (timestamp, success, latency_ms)
+    _ping_cache: ClassVar[dict[tuple[str, int], tuple[float, bool, float | None]]] = {}
+
+    # Successful DNS lookups are reused for this long (seconds)
+    RESOLVE_CACHE_TTL = 60.0
+
+    # hostname -> (timestamp, ip_address)
+    _resolve_cache: ClassVar[dict[str, tuple[float, str]]] = {}
+
     @staticmethod
-    def ping(host: str, timeout: int = 2000) -> tuple[bool, float | None]:
+    def ping(
+        host: str, timeout: int = 2000, use_cache: bool = True
+    ) -> tuple[bool, float | None]:
         """
         Execute ping to a host.
 
+        Sends a single ICMP echo in-process; falls back to the system ping
+        command when ICMP sockets are not available (e.g. not elevated).
+        Results are cached for PING_CACHE_TTL seconds.
+
         Args:
             host: IP address or hostname
             timeout: Timeout in milliseconds
+            use_cache: If False, always send a new echo request
 
         Returns:
             Tuple of (success, latency_ms)
         """
+        key = (host, timeout)
+        cached = NetworkChecker._ping_cache.get(key)
+        if (
+            use_cache
+            and cached
+            and time.monotonic() - cached[0] < NetworkChecker.PING_CACHE_TTL
+        ):
+            return cached[1], cached[2]
+
         try:
-            # Determine parameters based on OS
-            param = "-n" if platform.system().lower() == "windows" else "-c"
-            timeout_param = "-w" if platform.system().lower() == "windows" else "-W"
-            timeout_value = (
-                str(timeout)
-                if platform.system().lower() == "windows"
-                else str(timeout // 1000)
-            )
-
-            # Execute ping
-            command = ["ping", param, "1", timeout_param, timeout_value, host]
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                timeout=timeout / 1000 + 1,
-                check=False,
-                creationflags=SUBPROCESS_FLAGS,
-            )
-
-            success = result.returncode == 0
-
-            # Try to extract latency
-            latency = None
-            if success:
-                output = result.stdout.decode("utf-8", errors="ignore")
-                # Search for time in ms
-                match = re.search(r"time[=<](\d+)", output, re.IGNORECASE)
-                if match:
-                    latency = float(match.group(1))
-
-            return success, latency
+            result = NetworkChecker._icmp_ping(host, timeout)
+            if result is None:
+                result = NetworkChecker._ping_subprocess(host, timeout)
 
         except Exception as e:
             logger.error(f"Error executing ping to {host}: {e}")
             return False, None
 
+        NetworkChecker._ping_cache[key] = (time.monotonic(), *result)
+        return result
+
+    @staticmethod
+    def clear_ping_cache() -> None:
+        """Discard cached ping results (e.g. before an explicit refresh)."""
+        NetworkChecker._ping_cache.clear()
+
+    @staticmethod
+    def _icmp_ping(host: str, timeout: int) -> tuple[bool, float | None] | None:
+        """
+        Send one ICMP echo request using a raw (or unprivileged) socket.
+
+        Args:
+            host: IP address or hostname
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Tuple of (success, latency_ms), or None if ICMP sockets are unavailable
+        """
+        sock = None
+        for sock_type in (socket.SOCK_RAW, socket.SOCK_DGRAM):
+            try:
+                sock = socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+                break
+            except OSError:
+                continue
+        if sock is None:
+            return None
+
+        with sock:
+            is_raw = sock.type == socket.SOCK_RAW
+            ident = os.getpid() & 0xFFFF
+            sequence = next(_icmp_sequence) & 0xFFFF
+
+            header = _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, 0, ident, sequence)
+            checksum = _icmp_checksum(header + _ICMP_PAYLOAD)
+            header = _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, checksum, ident, sequence)
+
+            start = time.perf_counter()
+            deadline = start + timeout / 1000
+            try:
+                sock.sendto(header + _ICMP_PAYLOAD, (host, 0))
+            except OSError as e:
+                # Unresolvable or unreachable host: a normal offline answer
+                logger.debug("ICMP echo to %s failed: %s", host, e)
+                return False, None
+
+            while (remaining := deadline - time.perf_counter()) > 0:
+                sock.settimeout(remaining)
+                try:
+                    packet = sock.recv(1024)
+                except TimeoutError:
+                    break
+                except OSError as e:
+                    logger.debug("ICMP echo to %s failed: %s", host, e)
+                    return False, None
+
+                # Raw sockets include the IP header; datagram sockets don't
+                offset = (packet[0] & 0x0F) * 4 if is_raw else 0
+                if len(packet) < offset + 8:
+                    continue
+
+                icmp_type, _, _, reply_id, reply_seq = _ICMP_HEADER.unpack_from(
+                    packet, offset
+                )
+                # The kernel rewrites the identifier on datagram sockets
+                if (
+                    icmp_type == _ICMP_ECHO_REPLY
+                    and reply_seq == sequence
+                    and (reply_id == ident or not is_raw)
+                ):
+                    latency = (time.perf_counter() - start) * 1000
+                    return True, round(latency, 1)
+
+                # A router or the local stack reporting our echo as
+                # unreachable is a definitive answer; don't wait for timeout
+                if icmp_type == _ICMP_DEST_UNREACHABLE and is_raw:
+                    # The error quotes our IP header and our echo header
+                    quoted = offset + 8
+                    if len(packet) > quoted:
+                        quoted += (packet[quoted] & 0x0F) * 4
+                    if len(packet) >= quoted + 8:
+                        _, _, _, sent_id, sent_seq = _ICMP_HEADER.unpack_from(
+                            packet, quoted
+                        )
+                        if sent_id == ident and sent_seq == sequence:
+                            return False, None
+
+        return False, None
+
+    @staticmethod
+    def _ping_subprocess(host: str, timeout: int) -> tuple[bool, float | None]:
+        """
+        Ping a host using the system ping command.
+
+        Args:
+            host: IP address or hostname
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Tuple of (success, latency_ms)
+        """
+        count_param, timeout_param = _PING_PARAMS
+        timeout_value = str(timeout) if _IS_WINDOWS else str(timeout // 1000)
+
+        # Execute ping
+        command = ["ping", count_param, "1", timeout_param, timeout_value, host]
+        # Only stdout is parsed; stderr is discarded so it needs no pipe
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout / 1000 + 1,
+            check=False,
+            creationflags=SUBPROCESS_FLAGS,
+        )
+
+        success = result.returncode == 0
+
+        # Try to extract latency
+        latency = None
+        if success:
+            # Search for time in ms (raw bytes, no need to decode the output)
+            match = _LATENCY_RE.search(result.stdout)
+            if match:
+                latency = float(match.group(1))
+
+        return success, latency
+
     @staticmethod
     def check_port(host: str, port: int, timeout: int = 3000) -> bool:
         """
@@ -111,33 +290,83 @@ class NetworkChecker:
             True if the port is open
         """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout / 1000)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            return result == 0
+            with socket.create_connection((host, port), timeout=timeout / 1000):
+                return True
 
         except Exception as e:
-            logger.debug(f"Error checking port {port} on {host}: {e}")
+            logger.debug("Error checking port %d on %s: %s", port, host, e)
             return False
 
     @staticmethod
     def check_multiple_ports(host: str, ports: list[int], timeout: int = 3000) -> int:
         """
-        Check multiple TCP ports.
+        Check multiple TCP ports (alias for check_ports_batched).
 
         Args:
-            host: IP address or hostname
+            host: IP address
+            ports: List of ports to check
+            timeout: Timeout in milliseconds for the whole scan
+
+        Returns:
+            Number of open ports
+        """
+        return NetworkChecker.check_ports_batched(host, ports, timeout)
+
+    @staticmethod
+    def check_ports_batched(host: str, ports: list[int], timeout: int = 3000) -> int:
+        """
+        Check multiple TCP ports with non-blocking connects and select().
+
+        All connections are started at once and awaited together, so the
+        whole scan is bounded by a single timeout without spawning threads.
+
+        Args:
+            host: IP address
             ports: List of ports to check
-            timeout: Timeout in milliseconds per port
+            timeout: Timeout in milliseconds for the whole scan
 
         Returns:
             Number of open ports
         """
+        pending: list[socket.socket] = []
         open_count = 0
-        for port in ports:
-            if NetworkChecker.check_port(host, port, timeout):
-                open_count += 1
+
+        try:
+            for port in ports:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                pending.append(sock)
+                sock.setblocking(False)
+                result = sock.connect_ex((host, port))
+                if result == 0:
+                    open_count += 1
+                    pending.remove(sock)
+                    sock.close()
+                elif result not in _CONNECT_IN_PROGRESS:
+                    pending.remove(sock)
+                    sock.close()
+
+            deadline = time.monotonic() + timeout / 1000
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                # Windows reports failed connects in the exception set
+                _, writable, failed = select.select([], pending, pending, remaining)
+                for sock in {*writable, *failed}:
+                    error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if error == 0 and sock not in failed:
+                        open_count += 1
+                    pending.remove(sock)
+                    sock.close()
+
+        except Exception as e:
+            logger.debug("Error checking ports %s on %s: %s", ports, host, e)
+
+        finally:
+            for sock in pending:
+                sock.close()
+
         return open_count
 
     @staticmethod
@@ -147,6 +376,9 @@ class NetworkChecker:
         """
         Get complete connection status.
 
+        The port scan runs on a pooled thread while the ping runs here, so a
+        check takes the longer of the two timeouts rather than their sum.
+
         Args:
             host: IP address or hostname
             ports: Ports to check
@@ -158,16 +390,21 @@ class NetworkChecker:
         """
         status = ConnectionStatus()
 
+        # Resolve once so ping and every port probe use the same address
+        address = (host and NetworkChecker.resolve_hostname(host)) or host
+
+        ports_future = _status_pool.submit(
+            NetworkChecker.check_ports_batched, address, ports, port_timeout
+        )
+
         # Check ping
-        pingable, latency = NetworkChecker.ping(host, ping_timeout)
+        pingable, latency = NetworkChecker.ping(address, ping_timeout)
         status.pingable = pingable
         status.latency_ms = latency
 
-        # Check ports (only if ping works)
+        # Count ports only if ping works; otherwise the scan is left to finish
         if pingable:
-            status.ports_open = NetworkChecker.check_multiple_ports(
-                host, ports, port_timeout
-            )
+            status.ports_open = ports_future.result()
 
         # PC considered fully booted if ping OK and at least 2 ports open
         status.fully_booted = status.pingable and status.ports_open >= 2
@@ -179,13 +416,24 @@ class NetworkChecker:
         """
         Resolve hostname to IP address.
 
+        Successful lookups are cached for RESOLVE_CACHE_TTL seconds, so a
+        DHCP/DNS change is picked up; failures are never cached.
+
         Args:
             hostname: Hostname to resolve
 
         Returns:
             IP address or None if resolution fails
         """
+        cached = NetworkChecker._resolve_cache.get(hostname)
+        if cached and time.monotonic() - cached[0] < NetworkChecker.RESOLVE_CACHE_TTL:
+            return cached[1]
+
         try:
-            return socket.gethostbyname(hostname)
-        except socket.gaierror:
+            ip_address = socket.gethostbyname(hostname)
+        except (socket.gaierror, UnicodeError):
+            NetworkChecker._resolve_cache.pop(hostname, None)
             return None
+
+        NetworkChecker._resolve_cache[hostname] = (time.monotonic(), ip_address)
+        return ip_address
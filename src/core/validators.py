@@ -7,13 +7,32 @@ This module provides validation functions for various input types:
 - Port numbers
 - Hostnames
 - Windows usernames
+
+String validators are pure, so their results are memoized: the setup wizard
+re-validates the same field values on every back/forward navigation.
 """
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Positions of the separators in XX:XX:XX:XX:XX:XX / XX-XX-XX-XX-XX-XX
+_MAC_SEPARATOR_POSITIONS = frozenset(range(2, 17, 3))
+
+# Hostname labels can contain letters, numbers, and inner hyphens
+_HOSTNAME_LABEL_RE = re.compile(r"[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?")
 
+# Characters not allowed in Windows usernames
+# Note: backslash is allowed for DOMAIN\User format
+# Note: @ is allowed for UPN format (user@domain.com)
+_USERNAME_INVALID_CHARS = frozenset('"/[];|=,+*?<>')
 
+
+@lru_cache(maxsize=64)
 def validate_ip(ip: str) -> bool:
     """
     Validate an IPv4 address.
@@ -27,16 +46,21 @@ def validate_ip(ip: str) -> bool:
     if not ip:
         return False
 
-    pattern = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
-    match = re.match(pattern, ip)
-
-    if not match:
+    octets = ip.split(".")
+    if len(octets) != 4:
         return False
 
-    # Verify each octet is between 0-255
-    return all(0 <= int(octet) <= 255 for octet in match.groups())
+    # Each octet is 1-3 ASCII digits with a value between 0-255
+    return all(
+        0 < len(octet) <= 3
+        and octet.isascii()
+        and octet.isdigit()
+        and int(octet) <= 255
+        for octet in octets
+    )
 
 
+@lru_cache(maxsize=64)
 def validate_mac(mac: str) -> bool:
     """
     Validate a MAC address.
@@ -55,15 +79,19 @@ def validate_mac(mac: str) -> bool:
     # Remove whitespace
     mac = mac.strip()
 
-    # Accepted patterns
-    patterns = [
-        r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$",  # XX:XX... or XX-XX...
-        r"^([0-9A-Fa-f]{12})$",  # XXXXXXXXXXXX
-    ]
+    if len(mac) == 12:  # XXXXXXXXXXXX
+        return all(c in _HEX_DIGITS for c in mac)
 
-    return any(re.match(pattern, mac) for pattern in patterns)
+    if len(mac) == 17:  # XX:XX... or XX-XX...
+        return all(
+            c in ":-" if i in _MAC_SEPARATOR_POSITIONS else c in _HEX_DIGITS
+            for i, c in enumerate(mac)
+        )
 
+    return False
 
+
+@lru_cache(maxsize=64)
 def normalize_mac(mac: str) -> str | None:
     """
     Normalize MAC address to standard format (XX-XX-XX-XX-XX-XX).
@@ -77,8 +105,8 @@ def normalize_mac(mac: str) -> str | None:
     if not validate_mac(mac):
         return None
 
-    # Remove separators
-    clean_mac = mac.replace(":", "").replace("-", "").upper()
+    # Remove whitespace and separators
+    clean_mac = mac.strip().replace(":", "").replace("-", "").upper()
 
     # Format with hyphens
     return "-".join(clean_mac[i : i + 2] for i in range(0, 12, 2))
@@ -110,11 +138,12 @@ def validate_hostname(hostname: str) -> bool:
     if not hostname or len(hostname) > 253:
         return False
 
-    # Hostname can contain letters, numbers, hyphens, and dots
-    pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-    return bool(re.match(pattern, hostname))
+    # Match dot-separated labels one at a time instead of with a single
+    # repeated group, so a bad label fails without backtracking
+    return all(_HOSTNAME_LABEL_RE.fullmatch(label) for label in hostname.split("."))
 
 
+@lru_cache(maxsize=64)
 def validate_username(username: str) -> tuple[bool, str]:
     """
     Validate a Windows username.
@@ -133,12 +162,7 @@ def validate_username(username: str) -> tuple[bool, str]:
     if len(username) > 104:
         return False, "Nome de usuário muito longo (máximo: 104 caracteres)."
 
-    # Characters not allowed in Windows usernames
-    # Note: backslash is allowed for DOMAIN\User format
-    # Note: @ is allowed for UPN format (user@domain.com)
-    invalid_chars = r'["/\[\];|=,+*?<>]'
-
-    if re.search(invalid_chars, username):
+    if not _USERNAME_INVALID_CHARS.isdisjoint(username):
         return False, (
             "Nome de usuário contém caracteres inválidos.\n"
             'Não permitidos: " / [ ] ; | = , + * ? < >'
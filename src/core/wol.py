@@ -7,14 +7,18 @@ computers over the network using magic packets.
 
 from __future__ import annotations
 
-import ipaddress
 import socket
-import time
+import threading
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from src.core import logger
 from src.core.network import ConnectionStatus, NetworkChecker
-from src.core.validators import normalize_mac
+from src.core.validators import normalize_mac, validate_ip
+
+
+# Expedited Forwarding DSCP (46) in the upper six bits of the TOS byte
+_DSCP_EF = 46 << 2
 
 
 if TYPE_CHECKING:
@@ -26,6 +30,15 @@ if TYPE_CHECKING:
 class WakeOnLAN:
     """Wake-on-LAN manager."""
 
+    PACKET_REPEATS = 3
+    # Quick status checks while waiting start FIRST_PROBE_DELAY seconds apart
+    # and back off to PROBE_INTERVAL, using short timeouts
+    FIRST_PROBE_DELAY = 1.0
+    PROBE_INTERVAL = 5.0
+    BOOT_WAIT = 30  # seconds to wait for services once the PC answers ping
+    PROBE_PING_TIMEOUT = 500
+    PROBE_PORT_TIMEOUT = 1000
+
     def __init__(
         self,
         mac_address: str,
@@ -41,7 +54,7 @@ class WakeOnLAN:
             check_ports: Ports to verify status (default: RPC, SMB, WinRM)
 
         Raises:
-            ValueError: If MAC address is invalid
+            ValueError: If MAC or IP address is invalid
         """
         normalized = normalize_mac(mac_address)
         if not normalized:
@@ -51,7 +64,34 @@ class WakeOnLAN:
         self.ip_address = ip_address
         self.check_ports = check_ports or [135, 445, 5985]
 
+        # Build the Magic Packet once: 6 bytes FF + 16x MAC
+        mac_bytes = bytes.fromhex(normalized.replace("-", ""))
+        self._magic_packet = b"\xff" * 6 + mac_bytes * 16
+
+        # Subnet-directed and limited broadcast targets, each sent
+        # PACKET_REPEATS times in one burst
+        try:
+            self._subnet_broadcast_addr = self._subnet_broadcast(ip_address)
+        except ValueError:
+            # Hostname or non-IPv4 address: only the limited broadcast works
+            logger.debug(
+                "No subnet broadcast for %s, using limited broadcast", ip_address
+            )
+            self._subnet_broadcast_addr = "255.255.255.255"
+        self._targets = (
+            (self._subnet_broadcast_addr, 9),
+            (self._subnet_broadcast_addr, 7),
+            ("255.255.255.255", 9),
+        ) * self.PACKET_REPEATS
+
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask a running wake_and_wait to stop at its next wait."""
+        self._cancel_event.set()
+
     @staticmethod
+    @lru_cache(maxsize=16)
     def _subnet_broadcast(ip: str, prefix_len: int = 24) -> str:
         """
         Derive subnet-directed broadcast address from an IP.
@@ -62,9 +102,40 @@ class WakeOnLAN:
 
         Returns:
             Broadcast address (e.g. "192.168.1.255")
+
+        Raises:
+            ValueError: If the IP or prefix length is invalid
+        """
+        if not validate_ip(ip) or not 0 <= prefix_len <= 32:
+            raise ValueError(f"Invalid IPv4 network: {ip}/{prefix_len}")
+
+        # Set every host bit of the address
+        a, b, c, d = (int(octet) for octet in ip.split("."))
+        broadcast = (a << 24 | b << 16 | c << 8 | d) | ((1 << (32 - prefix_len)) - 1)
+        return ".".join(str(broadcast >> shift & 0xFF) for shift in (24, 16, 8, 0))
+
+    @staticmethod
+    def _set_priority(sock: socket.socket) -> None:
         """
-        network = ipaddress.IPv4Network(f"{ip}/{prefix_len}", strict=False)
-        return str(network.broadcast_address)
+        Mark the socket's traffic as high priority (best effort).
+
+        Sets the Expedited Forwarding DSCP so QoS-aware switches and Wi-Fi
+        queue the packets ahead of bulk traffic, plus SO_PRIORITY where the
+        platform has it (Linux).
+
+        Args:
+            sock: UDP socket used to send the Magic Packet
+        """
+        options = [(socket.IPPROTO_IP, socket.IP_TOS, _DSCP_EF)]
+        priority = getattr(socket, "SO_PRIORITY", None)
+        if priority is not None:
+            options.append((socket.SOL_SOCKET, priority, 6))
+
+        for level, option, value in options:
+            try:
+                sock.setsockopt(level, option, value)
+            except OSError as e:
+                logger.debug("Could not set socket option %d: %s", option, e)
 
     def send_magic_packet(self) -> bool:
         """
@@ -77,40 +148,27 @@ class WakeOnLAN:
             True if at least one packet was sent successfully
         """
         try:
-            # Remove separators and convert to bytes
-            mac_clean = self.mac_address.replace("-", "").replace(":", "")
-            mac_bytes = bytes.fromhex(mac_clean)
-
-            # Create Magic Packet: 6 bytes FF + 16x MAC
-            magic_packet = b"\xff" * 6 + mac_bytes * 16
-
-            # Determine broadcast addresses
-            subnet_broadcast = self._subnet_broadcast(self.ip_address)
-            targets = [
-                (subnet_broadcast, 9),
-                (subnet_broadcast, 7),
-                ("255.255.255.255", 9),
-            ]
-
             sent_count = 0
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-                for _repeat in range(3):
-                    for addr, port in targets:
-                        try:
-                            sock.sendto(magic_packet, (addr, port))
-                            sent_count += 1
-                        except OSError as e:
-                            logger.debug(f"Failed to send to {addr}:{port}: {e}")
+                self._set_priority(sock)
+                for target in self._targets:
+                    try:
+                        sock.sendto(self._magic_packet, target)
+                        sent_count += 1
+                    except OSError as e:
+                        logger.debug("Failed to send to %s:%d: %s", *target, e)
 
             logger.info(
-                f"Magic Packet sent to {self.mac_address} "
-                f"({sent_count} packets, broadcast={subnet_broadcast})"
+                "Magic Packet sent to %s (%d packets, broadcast=%s)",
+                self.mac_address,
+                sent_count,
+                self._subnet_broadcast_addr,
             )
             return sent_count > 0
 
         except Exception as e:
-            logger.error(f"Error sending Magic Packet: {e}")
+            logger.error("Error sending Magic Packet: %s", e)
             return False
 
     def check_status(
@@ -130,6 +188,12 @@ class WakeOnLAN:
             self.ip_address, self.check_ports, ping_timeout, port_timeout
         )
 
+    def _cancelled(self) -> tuple[bool, str]:
+        """Log and build the result of a cancelled wake_and_wait."""
+        message = "Processo de Wake-on-LAN cancelado"
+        logger.info(message)
+        return False, message
+
     def wake_and_wait(
         self,
         max_retries: int = 10,
@@ -150,8 +214,8 @@ class WakeOnLAN:
         """
         logger.info("=" * 50)
         logger.info("Starting Wake-on-LAN process")
-        logger.info(f"Target: {self.ip_address} ({self.mac_address})")
-        logger.info(f"Max attempts: {max_retries}")
+        logger.info("Target: %s (%s)", self.ip_address, self.mac_address)
+        logger.info("Max attempts: %d", max_retries)
         logger.info("=" * 50)
 
         # Check if already online
@@ -169,7 +233,7 @@ class WakeOnLAN:
 
         # Retry loop
         for attempt in range(1, max_retries + 1):
-            logger.info(f"--- Attempt {attempt}/{max_retries} ---")
+            logger.info("--- Attempt %d/%d ---", attempt, max_retries)
 
             # Send Magic Packet
             if not self.send_magic_packet():
@@ -182,42 +246,50 @@ class WakeOnLAN:
 
             # Wait before checking
             wait_time = 20 if attempt == 1 else retry_interval
-            logger.info(f"Waiting {wait_time}s before checking...")
-
-            # Check periodically during wait
-            for elapsed in range(wait_time):
-                time.sleep(1)
-
-                # Check every 5 seconds during wait
-                if elapsed % 5 == 0 and elapsed > 0:
-                    quick_status = self.check_status()
-
-                    if quick_status.pingable:
-                        logger.info("Ping detected during wait!")
-                        message = "PC de Áudio detectado! Verificando se está pronto..."
-                        if progress_callback:
-                            progress_callback(
-                                attempt, max_retries, message, quick_status
-                            )
-                        break
-
+            logger.info("Waiting %ds before checking...", wait_time)
+
+            # Check periodically during wait; the full check follows it
+            elapsed = 0.0
+            delay = self.FIRST_PROBE_DELAY
+            while elapsed < wait_time:
+                step = min(delay, wait_time - elapsed)
+                if self._cancel_event.wait(step):
+                    return self._cancelled()
+                elapsed += step
+                delay = min(delay * 1.5, self.PROBE_INTERVAL)
+
+                if elapsed >= wait_time:
+                    break
+
+                quick_status = self.check_status(
+                    self.PROBE_PING_TIMEOUT, self.PROBE_PORT_TIMEOUT
+                )
+
+                if quick_status.pingable:
+                    logger.info("Ping detected during wait!")
+                    message = "PC de Áudio detectado! Verificando se está pronto..."
                     if progress_callback:
-                        wait_msg = f"Aguardando resposta... ({elapsed}/{wait_time}s)"
-                        progress_callback(attempt, max_retries, wait_msg, quick_status)
+                        progress_callback(attempt, max_retries, message, quick_status)
+                    break
+
+                if progress_callback:
+                    wait_msg = f"Aguardando resposta... ({elapsed:.0f}/{wait_time}s)"
+                    progress_callback(attempt, max_retries, wait_msg, quick_status)
 
             # Full status check
             logger.info("Checking Audio PC status...")
             current_status = self.check_status()
 
             logger.info(
-                f"Status: Ping={current_status.pingable}, "
-                f"Ports open={current_status.ports_open}, "
-                f"Ready={current_status.fully_booted}"
+                "Status: Ping=%s, Ports open=%d, Ready=%s",
+                current_status.pingable,
+                current_status.ports_open,
+                current_status.fully_booted,
             )
 
             if current_status.fully_booted:
                 message = "PC de Áudio está online e pronto!"
-                logger.info(f"SUCCESS! {message}")
+                logger.info("SUCCESS! %s", message)
                 if progress_callback:
                     progress_callback(attempt, max_retries, message, current_status)
                 return True, message
@@ -227,24 +299,35 @@ class WakeOnLAN:
                 logger.info("PC responded to ping, waiting for system to load...")
                 message = "PC ligado, aguardando sistema carregar..."
 
-                # More frequent checks
-                for sub_check in range(6):
-                    time.sleep(5)
+                # More frequent checks, backing off like the wait above
+                elapsed = 0.0
+                delay = self.FIRST_PROBE_DELAY
+                while elapsed < self.BOOT_WAIT:
+                    step = min(delay, self.BOOT_WAIT - elapsed)
+                    if self._cancel_event.wait(step):
+                        return self._cancelled()
+                    elapsed += step
+                    delay = min(delay * 1.5, self.PROBE_INTERVAL)
+
                     sub_status = self.check_status()
 
                     logger.debug(
-                        f"Sub-check {sub_check + 1}/6: "
-                        f"Ping={sub_status.pingable}, "
-                        f"Ports={sub_status.ports_open}"
+                        "Sub-check at %.1fs: Ping=%s, Ports=%d",
+                        elapsed,
+                        sub_status.pingable,
+                        sub_status.ports_open,
                     )
 
                     if progress_callback:
-                        sub_msg = f"Sistema inicializando... ({sub_check + 1}/6)"
+                        sub_msg = (
+                            "Sistema inicializando... "
+                            f"({elapsed:.0f}/{self.BOOT_WAIT}s)"
+                        )
                         progress_callback(attempt, max_retries, sub_msg, sub_status)
 
                     if sub_status.fully_booted:
                         message = "PC de Áudio está online e pronto!"
-                        logger.info(f"SUCCESS! {message}")
+                        logger.info("SUCCESS! %s", message)
                         if progress_callback:
                             progress_callback(attempt, max_retries, message, sub_status)
                         return True, message
@@ -258,7 +341,7 @@ class WakeOnLAN:
         final_status = self.check_status()
         message = f"Não foi possível ligar PC de Áudio após {max_retries} tentativas"
         logger.error(message)
-        logger.error(f"Final status: {final_status.status_text}")
+        logger.error("Final status: %s", final_status.status_text)
 
         if progress_callback:
             progress_callback(max_retries, max_retries, message, final_status)
@@ -4,9 +4,33 @@ GUI module for Church Stream Sync.
 This module contains the graphical user interface components:
 - Startup window with progress feedback
 - Windows toast notifications
+
+Submodules are imported on first access, so importing one component (e.g.
+the tray icon) doesn't pull in the others.
 """
 
-from src.gui import notification, startup
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from src.gui import notification, startup
+
+
+_SUBMODULES = frozenset({"notification", "startup"})
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import GUI submodules lazily (PEP 562)."""
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"src.gui.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["notification", "startup"]
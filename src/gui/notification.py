@@ -8,11 +8,39 @@ to PyQt5 system tray notifications when win10toast is not available.
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from PyQt5.QtCore import QTimer
     from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+    from win10toast import ToastNotifier
+
+
+# Fallback application for processes without a GUI, created on first use.
+# Holding the reference keeps Qt from being torn down and rebuilt per call.
+_fallback_app: QApplication | None = None
+
+# Tray icon and hide timer shared by every Qt notification
+_tray: QSystemTrayIcon | None = None
+_hide_timer: QTimer | None = None
+
+
+@lru_cache(maxsize=1)
+def _get_toaster() -> ToastNotifier | None:
+    """
+    Get the shared win10toast notifier.
+
+    Returns:
+        ToastNotifier instance, or None if win10toast is not available
+    """
+    try:
+        from win10toast import ToastNotifier
+    except ImportError:
+        return None
+
+    return ToastNotifier()
 
 
 def show_notification(
@@ -32,24 +60,20 @@ def show_notification(
     """
     try:
         # Try using win10toast (if available)
-        try:
-            from win10toast import ToastNotifier
-
-            toaster = ToastNotifier()
-
-            toaster.show_toast(
-                title,
-                message,
-                duration=duration // 1000,  # Convert to seconds
-                threaded=False,
-            )
-
-            return True
-
-        except ImportError:
+        toaster = _get_toaster()
+        if toaster is None:
             # Fallback to PyQt5 if win10toast not available
             return _show_qt_notification(title, message, icon, duration)
 
+        toaster.show_toast(
+            title,
+            message,
+            duration=duration // 1000,  # Convert to seconds
+            threaded=False,
+        )
+
+        return True
+
     except Exception as e:
         print(f"Error showing notification: {e}")
         return False
@@ -59,6 +83,9 @@ def _show_qt_notification(title: str, message: str, icon: str, duration: int) ->
     """
     Show notification using PyQt5 system tray.
 
+    The tray icon and its hide timer are created on first use and reused,
+    so back-to-back notifications replace each other instead of piling up.
+
     Args:
         title: Notification title
         message: Notification message
@@ -70,19 +97,27 @@ def _show_qt_notification(title: str, message: str, icon: str, duration: int) ->
     """
     try:
         from PyQt5.QtCore import QTimer
-        from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+        from PyQt5.QtWidgets import QApplication, QStyle, QSystemTrayIcon
+
+        global _fallback_app, _tray, _hide_timer  # noqa: PLW0603
 
-        # Create temporary application if none exists
+        # Create the fallback application once if none exists
         app = QApplication.instance()
         if app is None:
-            app = QApplication(sys.argv)
+            app = _fallback_app = QApplication(sys.argv)
 
-        # Create tray icon
-        tray = QSystemTrayIcon()
+        if _tray is None or _hide_timer is None:
+            # Set icon (use system default icon)
+            tray = QSystemTrayIcon(
+                app.style().standardIcon(QStyle.SP_MessageBoxInformation)
+            )
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(_cleanup_tray)
+            _tray, _hide_timer = tray, timer
+        else:
+            tray, timer = _tray, _hide_timer
 
-        # Set icon (use system default icon)
-        icon_obj = tray.style().standardIcon(tray.style().SP_MessageBoxInformation)
-        tray.setIcon(icon_obj)
         tray.setVisible(True)
 
         # Map message type
@@ -95,9 +130,7 @@ def _show_qt_notification(title: str, message: str, icon: str, duration: int) ->
         # Show notification
         tray.showMessage(title, message, icon_type, duration)
 
-        # Timer to cleanup
-        timer = QTimer()
-        timer.timeout.connect(lambda: _cleanup_tray(tray, app))
+        # (Re)start the cleanup countdown
         timer.start(duration + 500)
 
         return True
@@ -107,22 +140,14 @@ def _show_qt_notification(title: str, message: str, icon: str, duration: int) ->
         return False
 
 
-def _cleanup_tray(tray: QSystemTrayIcon, app: QApplication) -> None:
-    """
-    Clean up tray icon after displaying notification.
-
-    Args:
-        tray: The system tray icon to clean up
-        app: The application instance
-    """
+def _cleanup_tray() -> None:
+    """Hide the tray icon once the last notification has expired."""
     try:
-        tray.hide()
-        tray.deleteLater()
+        if _tray is not None:
+            _tray.hide()
         # Don't close app if it's an existing instance
-        from PyQt5.QtWidgets import QApplication
-
-        if QApplication.instance() == app:
-            app.quit()
+        if _fallback_app is not None:
+            _fallback_app.quit()
     except Exception:
         pass
 
@@ -33,10 +33,6 @@ class ShutdownProgressWindow(QDialog):
         """Initialize the shutdown progress window."""
         super().__init__()
 
-        self.progress_value = 0
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._update_progress)
-
         self._init_ui()
 
         logger.info("Shutdown progress window created")
@@ -50,9 +46,9 @@ class ShutdownProgressWindow(QDialog):
         )
         self.setModal(True)
 
-        screen = QApplication.desktop().screenGeometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
+        screen = QApplication.primaryScreen().availableGeometry()
+        x = screen.x() + (screen.width() - self.width()) // 2
+        y = screen.y() + (screen.height() - self.height()) // 2
         self.move(x, y)
 
         main_layout = QVBoxLayout()
@@ -114,19 +110,13 @@ class ShutdownProgressWindow(QDialog):
     def start_progress(self):
         """Start the progress animation."""
         logger.info("Starting shutdown progress animation")
-        self.progress_value = 0
-        self.progress_bar.setValue(0)
-        self.timer.start(200)
+        # An empty range makes Qt draw its own busy indicator
+        self.progress_bar.setRange(0, 0)
 
     def stop_progress(self):
         """Stop the progress animation."""
         logger.info("Stopping shutdown progress animation")
-        self.timer.stop()
-
-    def _update_progress(self):
-        """Update progress bar with animation."""
-        self.progress_value = (self.progress_value + 2) % 100
-        self.progress_bar.setValue(self.progress_value)
+        self.progress_bar.setRange(0, 100)
 
     def update_status(self, message: str):
         """
@@ -135,7 +125,7 @@ class ShutdownProgressWindow(QDialog):
         Args:
             message: Status message to display
         """
-        logger.debug(f"Shutdown progress: {message}")
+        logger.debug("Shutdown progress: %s", message)
         self.status_label.setText(message)
 
     def set_complete(self, success: bool = True):
@@ -145,7 +135,7 @@ class ShutdownProgressWindow(QDialog):
         Args:
             success: Whether shutdown was successful
         """
-        self.timer.stop()
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(100)
 
         if success:
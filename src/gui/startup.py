@@ -8,6 +8,7 @@ of the Wake-on-LAN process with real-time status updates.
 from __future__ import annotations
 
 import sys
+import time
 from typing import TYPE_CHECKING
 
 from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
@@ -39,11 +40,16 @@ class WakeThread(QThread):
     progress = pyqtSignal(int, int, str, object)  # attempt, max, message, status
     finished_signal = pyqtSignal(bool, str)  # success, message
 
+    # Minimum seconds between progress emissions (~10 Hz)
+    PROGRESS_INTERVAL = 0.1
+
     def __init__(self, wol: WakeOnLAN, max_retries: int, retry_interval: int) -> None:
         super().__init__()
         self.wol = wol
         self.max_retries = max_retries
         self.retry_interval = retry_interval
+        self._last_emit = 0.0
+        self._pending: tuple[int, int, str, ConnectionStatus] | None = None
 
     def run(self) -> None:
         """Execute Wake-on-LAN in a separate thread."""
@@ -53,17 +59,38 @@ class WakeThread(QThread):
                 retry_interval=self.retry_interval,
                 progress_callback=self._on_progress,
             )
+            self._flush_progress()
             self.finished_signal.emit(success, message)
         except Exception as e:
             logger.exception("Error during Wake-on-LAN")
+            self._flush_progress()
             self.finished_signal.emit(False, f"Erro: {e!s}")
 
+    def cancel(self) -> None:
+        """Ask the Wake-on-LAN loop to stop at its next wait."""
+        self.wol.cancel()
+
     def _on_progress(
         self, attempt: int, max_attempts: int, message: str, status: ConnectionStatus
     ) -> None:
-        """Progress callback."""
+        """Progress callback, throttled so bursts don't flood the UI thread."""
+        now = time.monotonic()
+        final = status.fully_booted or attempt == max_attempts
+        if not final and now - self._last_emit < self.PROGRESS_INTERVAL:
+            # Keep only the latest update; it is sent before finishing
+            self._pending = (attempt, max_attempts, message, status)
+            return
+
+        self._last_emit = now
+        self._pending = None
         self.progress.emit(attempt, max_attempts, message, status)
 
+    def _flush_progress(self) -> None:
+        """Emit the last progress update dropped by the throttle, if any."""
+        if self._pending:
+            self.progress.emit(*self._pending)
+            self._pending = None
+
 
 class StartupWindow(QWidget):
     """Startup window with visual feedback."""
@@ -71,6 +98,53 @@ class StartupWindow(QWidget):
     # Signal emitted when window is closed (success: bool)
     closed = pyqtSignal(bool)
 
+    _PROGRESS_QSS = """
+        QProgressBar {
+            border: 2px solid #E0E0E0;
+            border-radius: 5px;
+            text-align: center;
+            background-color: #F5F5F5;
+            height: 28px;
+        }
+        QProgressBar::chunk {
+            background-color: #0078D4;
+            border-radius: 3px;
+        }
+    """
+    _PROGRESS_ERROR_QSS = """
+        QProgressBar {
+            border: 2px solid #FFE0E0;
+            border-radius: 5px;
+            text-align: center;
+            background-color: #FFF0F0;
+            height: 28px;
+        }
+        QProgressBar::chunk {
+            background-color: #D83B01;
+            border-radius: 3px;
+        }
+    """
+    _BUTTON_QSS = """
+        QPushButton {
+            background-color: #0078D4;
+            color: white;
+            border: none;
+            border-radius: 5px;
+            padding: 8px;
+        }
+        QPushButton:hover {
+            background-color: #106EBE;
+        }
+        QPushButton:pressed {
+            background-color: #005A9E;
+        }
+    """
+    _WINDOW_QSS = """
+        QWidget {
+            background-color: white;
+        }
+    """
+
     def __init__(self) -> None:
         super().__init__()
         self.config = get_config()
@@ -88,9 +162,9 @@ class StartupWindow(QWidget):
         self.setWindowFlags(Qt.Window | Qt.WindowStaysOnTopHint)
 
         # Center on screen
-        screen = QApplication.desktop().screenGeometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
+        screen = QApplication.primaryScreen().availableGeometry()
+        x = screen.x() + (screen.width() - self.width()) // 2
+        y = screen.y() + (screen.height() - self.height()) // 2
         self.move(x, y)
 
         # Main layout
@@ -134,19 +208,7 @@ class StartupWindow(QWidget):
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(True)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #E0E0E0;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #F5F5F5;
-                height: 28px;
-            }
-            QProgressBar::chunk {
-                background-color: #0078D4;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(self._PROGRESS_QSS)
         main_layout.addWidget(self.progress_bar)
 
         # Attempt label
@@ -164,21 +226,7 @@ class StartupWindow(QWidget):
         self.ok_button = QPushButton("OK")
         self.ok_button.setFont(QFont("Segoe UI", 10))
         self.ok_button.setFixedSize(120, 40)
-        self.ok_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D4;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #106EBE;
-            }
-            QPushButton:pressed {
-                background-color: #005A9E;
-            }
-        """)
+        self.ok_button.setStyleSheet(self._BUTTON_QSS)
         self.ok_button.clicked.connect(self.close)
         self.ok_button.hide()
 
@@ -192,11 +240,7 @@ class StartupWindow(QWidget):
         self.setLayout(main_layout)
 
         # Window style
-        self.setStyleSheet("""
-            QWidget {
-                background-color: white;
-            }
-        """)
+        self.setStyleSheet(self._WINDOW_QSS)
 
     def _start_wake_process(self) -> None:
         """Start the Wake-on-LAN process."""
@@ -213,8 +257,10 @@ class StartupWindow(QWidget):
                 wol, self.config.network.max_retries, self.config.network.retry_interval
             )
 
-            self.wake_thread.progress.connect(self._on_progress)
-            self.wake_thread.finished_signal.connect(self._on_finished)
+            self.wake_thread.progress.connect(self._on_progress, Qt.QueuedConnection)
+            self.wake_thread.finished_signal.connect(
+                self._on_finished, Qt.QueuedConnection
+            )
             self.wake_thread.start()
 
         except Exception as e:
@@ -242,7 +288,7 @@ class StartupWindow(QWidget):
         self.progress_bar.setValue(int(progress))
 
         # Log
-        logger.debug(f"Progress: {attempt}/{max_attempts} - {message}")
+        logger.debug("Progress: %d/%d - %s", attempt, max_attempts, message)
 
     def _on_finished(self, success: bool, message: str) -> None:
         """Called when process finishes."""
@@ -262,7 +308,7 @@ class StartupWindow(QWidget):
         self.attempt_label.hide()
         self.ok_button.show()
 
-        logger.info(f"Success: {message}")
+        logger.info("Success: %s", message)
 
         # Auto-close after delay
         if self.config.ui.auto_close_delay > 0:
@@ -279,24 +325,12 @@ class StartupWindow(QWidget):
         self.details_label.setText(message)
         self.details_label.setStyleSheet("color: #D83B01;")
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #FFE0E0;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #FFF0F0;
-                height: 28px;
-            }
-            QProgressBar::chunk {
-                background-color: #D83B01;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(self._PROGRESS_ERROR_QSS)
         self.attempt_label.hide()
         self.ok_button.show()
         self.ok_button.setText("Fechar")
 
-        logger.error(f"Error: {message}")
+        logger.error("Error: %s", message)
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Called when window is closed."""
@@ -306,8 +340,11 @@ class StartupWindow(QWidget):
 
         # Stop thread if still running
         if self.wake_thread and self.wake_thread.isRunning():
-            self.wake_thread.terminate()
-            self.wake_thread.wait()
+            self.wake_thread.cancel()
+            # A status check may still be in flight; don't wait on it forever
+            if not self.wake_thread.wait(2000):
+                self.wake_thread.terminate()
+                self.wake_thread.wait()
 
         # Emit closed signal with success status
         self.closed.emit(self.success)
@@ -322,7 +359,7 @@ def show_startup_window() -> int:
     Returns:
         Application exit code
     """
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
     app.setStyle("Fusion")  # Modern style
 
     window = StartupWindow()
@@ -14,7 +14,7 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING
 
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QAction,
     QMenu,
@@ -23,13 +23,37 @@ from PyQt5.QtWidgets import (
 )
 
 from src.core import logger
-from src.core.network import NetworkChecker
+from src.core.network import ConnectionStatus, NetworkChecker
+from src.utils.windows import watch_address_changes
 
 
 if TYPE_CHECKING:
     from src.service.background import BackgroundService
 
 
+class StatusCheckThread(QThread):
+    """Thread to probe the Audio PC without blocking the tray menu."""
+
+    finished_signal = pyqtSignal(object)  # ConnectionStatus, or None on error
+
+    def __init__(self, host: str, ports: list[int]) -> None:
+        super().__init__()
+        self.host = host
+        self.ports = ports
+
+    def run(self) -> None:
+        """Check the Audio PC status."""
+        try:
+            status = NetworkChecker.get_status(
+                self.host, ports=self.ports, ping_timeout=2000
+            )
+        except Exception as e:
+            logger.error("Error updating status: %s", e)
+            status = None
+
+        self.finished_signal.emit(status)
+
+
 class SystemTrayIcon(QSystemTrayIcon):
     """
     System tray icon for the background service.
@@ -38,6 +62,20 @@ class SystemTrayIcon(QSystemTrayIcon):
     runs in the background.
     """
 
+    # Emitted from a watcher thread when a local network address changes
+    network_changed = pyqtSignal()
+
+    # Status polling interval (ms): relaxed while the Audio PC is steadily
+    # online; offline (most of the week) keeps the original 30 s rate
+    STATUS_INTERVAL_ONLINE = 60000
+    STATUS_INTERVAL_OFFLINE = 30000
+
+    _STATUS_ONLINE = "🟢 PC de Áudio: Online ({latency}ms)"
+    _STATUS_OFFLINE = "🔴 PC de Áudio: Offline"
+    _STATUS_UNKNOWN = "🟡 PC de Áudio: Status desconhecido"
+    _TOOLTIP_ONLINE = "Church Stream Sync\nPC de Áudio: Online"
+    _TOOLTIP_OFFLINE = "Church Stream Sync\nPC de Áudio: Offline"
+
     def __init__(self, service: BackgroundService):
         """
         Initialize the system tray icon.
@@ -50,19 +88,24 @@ class SystemTrayIcon(QSystemTrayIcon):
         self.service = service
         self.config = service.config
 
-        # Status check timer
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self._update_status)
-        self.status_timer.start(30000)  # Update every 30 seconds
-
         # Current status
         self.audio_pc_online = False
         self.audio_pc_latency = 0
+        self._status_thread: StatusCheckThread | None = None
+
+        # Status check timer
+        self.status_timer = QTimer()
+        self.status_timer.timeout.connect(self._update_status)
+        self.status_timer.start(self._interval_for(self.audio_pc_online))
 
         # Setup icon and menu
         self._setup_icon()
         self._create_menu()
 
+        # Re-check immediately when the local network changes (Windows)
+        self.network_changed.connect(self._on_network_changed, Qt.QueuedConnection)
+        watch_address_changes(self.network_changed.emit)
+
         # Initial status update
         self._update_status()
 
@@ -119,31 +162,69 @@ class SystemTrayIcon(QSystemTrayIcon):
 
         self.setContextMenu(menu)
 
+    def _interval_for(self, online: bool) -> int:
+        """
+        Get the status polling interval for the given state.
+
+        Args:
+            online: Whether the Audio PC is online
+
+        Returns:
+            Interval in milliseconds
+        """
+        return self.STATUS_INTERVAL_ONLINE if online else self.STATUS_INTERVAL_OFFLINE
+
     def _update_status(self):
-        """Update Audio PC status in the menu."""
-        try:
-            checker = NetworkChecker()
-            status = checker.get_status(
-                self.config.audio_pc.ip_address,
-                ports=self.config.network.check_ports,
-                ping_timeout=2000,
-            )
+        """Start a background check of the Audio PC status."""
+        # Skip the tick if the previous probe is still running
+        if self._status_thread and self._status_thread.isRunning():
+            return
 
+        self._status_thread = StatusCheckThread(
+            self.config.audio_pc.ip_address, self.config.network.check_ports
+        )
+        self._status_thread.finished_signal.connect(
+            self._on_status_ready, Qt.QueuedConnection
+        )
+        self._status_thread.start()
+
+    def _on_network_changed(self):
+        """Probe the Audio PC after a local network change."""
+        NetworkChecker.clear_ping_cache()
+        self._update_status()
+
+    def _on_status_ready(self, status: ConnectionStatus | None):
+        """
+        Update Audio PC status in the menu.
+
+        Args:
+            status: Result of the probe, or None if it failed
+        """
+        was_online = self.audio_pc_online
+
+        if status is None:
+            status_text = self._STATUS_UNKNOWN
+        else:
             self.audio_pc_online = status.is_online
             self.audio_pc_latency = status.latency_ms or 0
 
             if status.is_online:
-                status_text = f"🟢 PC de Áudio: Online ({status.latency_ms}ms)"
-                self.setToolTip("Church Stream Sync\nPC de Áudio: Online")
+                status_text = self._STATUS_ONLINE.format(latency=status.latency_ms)
+                tooltip = self._TOOLTIP_ONLINE
             else:
-                status_text = "🔴 PC de Áudio: Offline"
-                self.setToolTip("Church Stream Sync\nPC de Áudio: Offline")
+                status_text = self._STATUS_OFFLINE
+                tooltip = self._TOOLTIP_OFFLINE
+
+            # Setters notify Qt even when the text is unchanged
+            if self.toolTip() != tooltip:
+                self.setToolTip(tooltip)
 
+        if self.status_action.text() != status_text:
             self.status_action.setText(status_text)
 
-        except Exception as e:
-            logger.error(f"Error updating status: {e}")
-            self.status_action.setText("🟡 PC de Áudio: Status desconhecido")
+        # Only touch the timer on a state change, since setInterval restarts it
+        if self.audio_pc_online != was_online:
+            self.status_timer.setInterval(self._interval_for(self.audio_pc_online))
 
     def _shutdown_audio_pc_now(self):
         """Shutdown the Audio PC immediately (manual trigger)."""
@@ -196,6 +277,7 @@ class SystemTrayIcon(QSystemTrayIcon):
                     )
 
                 # Update status immediately
+                NetworkChecker.clear_ping_cache()
                 self._update_status()
 
             except Exception as e:
@@ -221,21 +303,23 @@ class SystemTrayIcon(QSystemTrayIcon):
             result = wizard.exec_()
 
             if result == SetupWizard.Accepted:
-                logger.info("Configuration updated, restarting service...")
+                try:
+                    self.service.reload_config()
+                except Exception:
+                    logger.exception("Could not reload configuration")
+                    self._restart()
+                    return
 
-                # Show message
                 self.showMessage(
                     "Church Stream Sync",
-                    "Configuração atualizada! Reiniciando...",
+                    "Configuração atualizada!",
                     QSystemTrayIcon.Information,
                     3000,
                 )
 
-                # Restart the application
-                import sys
-
-                python = sys.executable
-                os.execl(python, python, *sys.argv)
+                # Probe the (possibly new) Audio PC right away
+                NetworkChecker.clear_ping_cache()
+                self._update_status()
 
         except Exception as e:
             logger.exception("Error opening configuration")
@@ -245,6 +329,25 @@ class SystemTrayIcon(QSystemTrayIcon):
                 f"Erro ao abrir configurações:\n{e!s}",
             )
 
+    def _restart(self):
+        """Restart the application with the saved configuration."""
+        logger.info("Configuration updated, restarting service...")
+
+        # Show message
+        self.showMessage(
+            "Church Stream Sync",
+            "Configuração atualizada! Reiniciando...",
+            QSystemTrayIcon.Information,
+            3000,
+        )
+
+        # Restart the application
+        import sys
+
+        python = sys.executable
+        logger.close()  # execl skips atexit handlers
+        os.execl(python, python, *sys.argv)
+
     def _open_logs(self):
         """Open the logs directory in Windows Explorer."""
         logger.info("Opening logs directory from tray menu")
@@ -287,8 +390,10 @@ class SystemTrayIcon(QSystemTrayIcon):
         if reply == QMessageBox.Yes:
             logger.info("User confirmed exit, shutting down service")
 
-            # Stop status timer
+            # Stop status timer and let an in-flight probe finish
             self.status_timer.stop()
+            if self._status_thread:
+                self._status_thread.wait()
 
             # Hide tray icon
             self.hide()
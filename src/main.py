@@ -9,6 +9,7 @@ It routes execution to either:
 
 from __future__ import annotations
 
+import contextlib
 import os
 import sys
 
@@ -19,6 +20,47 @@ from src.core.config import Config
 from src.utils.windows import ensure_single_instance
 
 
+def _get_app() -> QApplication:
+    """
+    Get the process-wide QApplication, creating it on first use.
+
+    Returns:
+        The QApplication instance
+    """
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def _show_message(
+    icon: QMessageBox.Icon,
+    title: str,
+    text: str,
+    informative: str | None = None,
+    detailed: str | None = None,
+) -> None:
+    """
+    Show a modal message box with an OK button.
+
+    Args:
+        icon: Message box icon
+        title: Window title
+        text: Main message
+        informative: Optional informative text shown below the message
+        detailed: Optional text revealed by the "Show Details" button
+    """
+    _get_app()
+
+    msg = QMessageBox()
+    msg.setIcon(icon)
+    msg.setWindowTitle(title)
+    msg.setText(text)
+    if informative:
+        msg.setInformativeText(informative)
+    if detailed:
+        msg.setDetailedText(detailed)
+    msg.setStandardButtons(QMessageBox.Ok)
+    msg.exec_()
+
+
 def run_setup_mode() -> None:
     """
     Run the setup wizard to configure the application.
@@ -31,7 +73,7 @@ def run_setup_mode() -> None:
     try:
         from installer.setup import run_setup_wizard
 
-        _ = QApplication(sys.argv)
+        _get_app()
 
         # Run setup wizard
         success = run_setup_wizard()
@@ -41,6 +83,7 @@ def run_setup_mode() -> None:
 
             # Restart application in service mode
             python = sys.executable
+            logger.close()  # execl skips atexit handlers
             os.execl(python, python, *sys.argv)
         else:
             logger.info("Setup cancelled by user")
@@ -49,16 +92,13 @@ def run_setup_mode() -> None:
     except Exception as e:
         logger.exception("Error during setup")
 
-        try:
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Critical)
-            msg.setWindowTitle("Erro no Instalador")
-            msg.setText("Ocorreu um erro durante a configuração.")
-            msg.setDetailedText(str(e))
-            msg.setStandardButtons(QMessageBox.Ok)
-            msg.exec_()
-        except Exception:
-            pass
+        with contextlib.suppress(Exception):
+            _show_message(
+                QMessageBox.Critical,
+                "Erro no Instalador",
+                "Ocorreu um erro durante a configuração.",
+                detailed=str(e),
+            )
 
         sys.exit(1)
 
@@ -82,17 +122,12 @@ def run_service_mode() -> None:
         if not is_valid:
             logger.error(f"Invalid configuration: {error_message}")
 
-            _ = QApplication(sys.argv)
-
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Critical)
-            msg.setWindowTitle("Erro de Configuração")
-            msg.setText("Configuração inválida detectada.")
-            msg.setInformativeText(
-                error_message + "\n\nExecute o instalador novamente."
+            _show_message(
+                QMessageBox.Critical,
+                "Erro de Configuração",
+                "Configuração inválida detectada.",
+                informative=error_message + "\n\nExecute o instalador novamente.",
             )
-            msg.setStandardButtons(QMessageBox.Ok)
-            msg.exec_()
 
             sys.exit(1)
 
@@ -113,18 +148,13 @@ def run_service_mode() -> None:
     except Exception as e:
         logger.exception("Fatal error during service execution")
 
-        try:
-            _ = QApplication(sys.argv)
-
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Critical)
-            msg.setWindowTitle("Erro Fatal")
-            msg.setText("Ocorreu um erro inesperado.")
-            msg.setDetailedText(str(e))
-            msg.setStandardButtons(QMessageBox.Ok)
-            msg.exec_()
-        except Exception:
-            pass
+        with contextlib.suppress(Exception):
+            _show_message(
+                QMessageBox.Critical,
+                "Erro Fatal",
+                "Ocorreu um erro inesperado.",
+                detailed=str(e),
+            )
 
         sys.exit(1)
 
@@ -145,17 +175,12 @@ def main() -> None:
         if not ensure_single_instance():
             logger.warning("Another instance is already running")
 
-            _ = QApplication(sys.argv)
-
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Information)
-            msg.setWindowTitle("Já em Execução")
-            msg.setText("Church Stream Sync já está rodando.")
-            msg.setInformativeText(
-                "Verifique o ícone na bandeja do sistema (system tray)."
+            _show_message(
+                QMessageBox.Information,
+                "Já em Execução",
+                "Church Stream Sync já está rodando.",
+                informative="Verifique o ícone na bandeja do sistema (system tray).",
             )
-            msg.setStandardButtons(QMessageBox.Ok)
-            msg.exec_()
 
             sys.exit(0)
 
@@ -11,25 +11,67 @@ This module contains the main background service that:
 from __future__ import annotations
 
 import ctypes
+import importlib
 import sys
-import time
 from ctypes import wintypes
 from typing import TYPE_CHECKING
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QApplication, QWidget
 
 from src.core import logger
 from src.core.config import Config
-from src.core.network import NetworkChecker
 from src.core.wol import WakeOnLAN
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.gui.startup import StartupWindow
     from src.gui.tray import SystemTrayIcon
 
 
+def _load_shutdown_api() -> tuple[Callable, Callable, Callable] | None:
+    """
+    Bind the Win32 shutdown functions with their prototypes.
+
+    Returns:
+        (ShutdownBlockReasonCreate, ShutdownBlockReasonDestroy,
+        SetProcessShutdownParameters), or None if unavailable
+    """
+    if sys.platform != "win32":
+        return None
+
+    try:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+        create = user32.ShutdownBlockReasonCreate
+        create.argtypes = (wintypes.HWND, wintypes.LPCWSTR)
+        create.restype = wintypes.BOOL
+
+        destroy = user32.ShutdownBlockReasonDestroy
+        destroy.argtypes = (wintypes.HWND,)
+        destroy.restype = wintypes.BOOL
+
+        set_parameters = kernel32.SetProcessShutdownParameters
+        set_parameters.argtypes = (wintypes.DWORD, wintypes.DWORD)
+        set_parameters.restype = wintypes.BOOL
+    except (AttributeError, OSError) as e:
+        logger.error("Failed to load Windows shutdown APIs: %s", e)
+        return None
+
+    return create, destroy, set_parameters
+
+
+# Resolved once at import; every ShutdownHandler shares the same bindings
+_SHUTDOWN_API = _load_shutdown_api()
+
+_WINDOWS_GENERIC_MSG = b"windows_generic_MSG"
+_WM_QUERYENDSESSION = 0x0011
+_MSG_MESSAGE_OFFSET = wintypes.MSG.message.offset
+
+
 class ShutdownHandler(QWidget):
     """
     Handles Windows shutdown events and manages Audio PC shutdown.
@@ -51,20 +93,12 @@ class ShutdownHandler(QWidget):
         self.service = service
         self.is_shutting_down = False
 
-        # Load Windows DLLs for shutdown blocking
-        try:
-            self.user32 = ctypes.windll.user32
-            self.user32.ShutdownBlockReasonCreate.argtypes = [
-                wintypes.HWND,
-                wintypes.LPCWSTR,
-            ]
-            self.user32.ShutdownBlockReasonCreate.restype = wintypes.BOOL
-            self.user32.ShutdownBlockReasonDestroy.argtypes = [wintypes.HWND]
-            self.user32.ShutdownBlockReasonDestroy.restype = wintypes.BOOL
-            logger.info("Windows shutdown APIs loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load Windows shutdown APIs: {e}")
-            self.user32 = None
+        # The window handle is stable for the widget's lifetime
+        self._hwnd = int(self.winId())
+        self._block_reason_create = None
+        self._block_reason_destroy = None
+        if _SHUTDOWN_API is not None:
+            self._block_reason_create, self._block_reason_destroy, _ = _SHUTDOWN_API
 
     def nativeEvent(self, eventType: bytes, message: int) -> tuple[bool, int]:
         """
@@ -79,25 +113,29 @@ class ShutdownHandler(QWidget):
         Returns:
             Tuple of (handled, result)
         """
-        if eventType == b"windows_generic_MSG":
-            try:
-                msg = wintypes.MSG.from_address(int(message))
+        if eventType != _WINDOWS_GENERIC_MSG:
+            return False, 0
 
-                # WM_QUERYENDSESSION = 0x0011
-                if msg.message == 0x0011:
-                    logger.info("Windows shutdown event detected (WM_QUERYENDSESSION)")
+        try:
+            # Read only MSG.message instead of wrapping the whole structure
+            message_id = ctypes.c_uint.from_address(
+                int(message) + _MSG_MESSAGE_OFFSET
+            ).value
+        except Exception as e:
+            logger.error("Error handling native event: %s", e)
+            return False, 0
 
-                    if not self.is_shutting_down:
-                        self.is_shutting_down = True
-                        self.shutdown_requested.emit()
+        if message_id != _WM_QUERYENDSESSION:
+            return False, 0
 
-                    # Block shutdown temporarily
-                    return True, 0
+        logger.info("Windows shutdown event detected (WM_QUERYENDSESSION)")
 
-            except Exception as e:
-                logger.error(f"Error handling native event: {e}")
+        if not self.is_shutting_down:
+            self.is_shutting_down = True
+            self.shutdown_requested.emit()
 
-        return False, 0
+        # Block shutdown temporarily
+        return True, 0
 
     def block_shutdown(self, reason: str = "Desligando PC de Áudio...") -> bool:
         """
@@ -109,13 +147,12 @@ class ShutdownHandler(QWidget):
         Returns:
             True if blocked successfully
         """
-        if not self.user32:
+        if self._block_reason_create is None:
             logger.warning("Cannot block shutdown: Windows APIs not available")
             return False
 
         try:
-            hwnd = int(self.winId())
-            result = self.user32.ShutdownBlockReasonCreate(hwnd, reason)
+            result = self._block_reason_create(self._hwnd, reason)
 
             if result:
                 logger.info(f"Shutdown blocked: {reason}")
@@ -134,12 +171,11 @@ class ShutdownHandler(QWidget):
         Returns:
             True if unblocked successfully
         """
-        if not self.user32:
+        if self._block_reason_destroy is None:
             return False
 
         try:
-            hwnd = int(self.winId())
-            result = self.user32.ShutdownBlockReasonDestroy(hwnd)
+            result = self._block_reason_destroy(self._hwnd)
 
             if result:
                 logger.info("Shutdown unblocked")
@@ -155,7 +191,7 @@ class ShutdownHandler(QWidget):
 class WakeThread(QThread):
     """Thread for executing WOL operation without blocking UI."""
 
-    progress = pyqtSignal(dict)
+    progress = pyqtSignal(int, int, str, object)  # attempt, max, message, status
     finished = pyqtSignal(bool)
 
     def __init__(self, config: Config):
@@ -177,23 +213,11 @@ class WakeThread(QThread):
                 check_ports=self.config.network.check_ports,
             )
 
-            # Progress callback for UI updates
-            def on_progress(
-                attempt: int, max_attempts: int, message: str, status: object
-            ) -> None:
-                self.progress.emit(
-                    {
-                        "attempt": attempt,
-                        "max_attempts": max_attempts,
-                        "message": message,
-                        "status": status,
-                    }
-                )
-
+            # The callback's arguments match the signal, so emit it directly
             success, _ = wol.wake_and_wait(
                 max_retries=self.config.network.max_retries,
                 retry_interval=self.config.network.retry_interval,
-                progress_callback=on_progress,
+                progress_callback=self.progress.emit,
             )
             self.finished.emit(success)
 
@@ -213,6 +237,9 @@ class BackgroundService:
     4. Runs continuously until system shutdown
     """
 
+    # Delay before quitting after the shutdown block is released (ms)
+    QUIT_DELAY = 200
+
     def __init__(self):
         """Initialize the background service."""
         self.config = Config.load()
@@ -220,9 +247,30 @@ class BackgroundService:
         self.shutdown_handler: ShutdownHandler | None = None
         self.tray_icon: SystemTrayIcon | None = None
         self.startup_window: StartupWindow | None = None
+        self.wol_thread: WakeThread | None = None
 
         logger.info("BackgroundService initialized")
 
+    def reload_config(self):
+        """
+        Re-read the configuration file into the existing Config object.
+
+        The object is updated in place, so components holding a reference
+        to it (tray icon, shutdown handling) pick up the new settings.
+        Parsing is skipped when the file hasn't changed since it was read.
+
+        Raises:
+            RuntimeError: If the configuration could not be read or is invalid
+        """
+        if not self.config.maybe_reload():
+            raise RuntimeError("Could not read configuration file")
+
+        is_valid, error_message = self.config.validate()
+        if not is_valid:
+            raise RuntimeError(f"Invalid configuration: {error_message}")
+
+        logger.info("Configuration reloaded")
+
     def start(self):
         """
         Start the background service.
@@ -240,12 +288,14 @@ class BackgroundService:
         self.app.setQuitOnLastWindowClosed(False)
 
         # Set process shutdown parameters (shutdown late in the sequence)
-        try:
-            kernel32 = ctypes.windll.kernel32
-            kernel32.SetProcessShutdownParameters(0x3FF, 0)
+        if _SHUTDOWN_API is None:
+            logger.warning("Could not set shutdown parameters: API not available")
+        elif _SHUTDOWN_API[2](0x3FF, 0):
             logger.info("Process shutdown parameters set")
-        except Exception as e:
-            logger.warning(f"Could not set shutdown parameters: {e}")
+        else:
+            logger.warning(
+                "Could not set shutdown parameters: error %d", ctypes.get_last_error()
+            )
 
         # Initialize shutdown handler
         self.shutdown_handler = ShutdownHandler(self)
@@ -260,11 +310,24 @@ class BackgroundService:
         self.tray_icon = SystemTrayIcon(self)
         self.tray_icon.show()
 
+        # Load the shutdown path and tray menu handlers while idle;
+        # WM_QUERYENDSESSION leaves no time
+        QTimer.singleShot(2000, self._prewarm_imports)
+
         logger.info("Background service started, entering event loop")
 
         # Enter Qt event loop (blocks until app exits)
         sys.exit(self.app.exec_())
 
+    @staticmethod
+    def _prewarm_imports():
+        """Import the modules used on shutdown and by the tray menu ahead of time."""
+        for module in ("src.gui.shutdown_progress", "src.shutdown", "installer.setup"):
+            try:
+                importlib.import_module(module)
+            except Exception as e:
+                logger.debug("Could not pre-import %s: %s", module, e)
+
     def _send_wol(self):
         """Send WOL packet and show progress window if enabled."""
         logger.info("Sending WOL to Audio PC...")
@@ -281,9 +344,10 @@ class BackgroundService:
             self.startup_window.show()
         else:
             # Silent mode - just send WOL without UI
-            wol_thread = WakeThread(self.config)
-            wol_thread.finished.connect(self._on_wol_finished)
-            wol_thread.start()
+            # Keep a reference: a QThread collected while running aborts Qt
+            self.wol_thread = WakeThread(self.config)
+            self.wol_thread.finished.connect(self._on_wol_finished, Qt.QueuedConnection)
+            self.wol_thread.start()
 
     def _on_wol_finished(self, success: bool):
         """
@@ -330,16 +394,15 @@ class BackgroundService:
                 self.shutdown_handler.unblock_shutdown()
 
             logger.info("Allowing Windows shutdown to proceed")
-            time.sleep(1)
-            self.app.quit()
+            # Quit from the event loop so the final status can still repaint
+            QTimer.singleShot(self.QUIT_DELAY, self.app.quit)
 
     def _shutdown_audio_pc(self, progress_window=None) -> bool:
         """
-        Shutdown the Audio PC with timeout protection.
+        Shutdown the Audio PC and wait for confirmation.
 
-        This method will attempt to shut down the Audio PC and wait
-        for confirmation, but will not block Windows shutdown for more
-        than 60 seconds.
+        RemoteShutdown skips the shutdown if the Audio PC is already offline
+        and polls until it goes down, reporting progress to the window.
 
         Args:
             progress_window: Optional progress window to update
@@ -347,35 +410,12 @@ class BackgroundService:
         Returns:
             True if shutdown was successful
         """
-        MAX_TIMEOUT = 60  # seconds
-        start_time = time.time()
-
         logger.info("Starting Audio PC shutdown sequence...")
 
         try:
-            # Quick check: is Audio PC already offline?
-            if progress_window:
-                progress_window.update_status("Verificando status do PC de áudio...")
-
-            checker = NetworkChecker()
-            status = checker.get_status(
-                self.config.audio_pc.ip_address,
-                ports=self.config.network.check_ports,
-                ping_timeout=2000,
-            )
-
-            if not status.is_online:
-                logger.info("Audio PC is already offline, skipping shutdown")
-                if progress_window:
-                    progress_window.update_status("PC de áudio já está offline")
-                return True
-
             # Import shutdown module
             from src.shutdown import RemoteShutdown
 
-            if progress_window:
-                progress_window.update_status("Enviando comando de desligamento...")
-
             # Create shutdown instance
             shutdown = RemoteShutdown(
                 ip_address=self.config.audio_pc.ip_address,
@@ -384,38 +424,19 @@ class BackgroundService:
             )
 
             # Execute shutdown with expedited mode (shorter timeouts)
-            success = shutdown.execute(expedited=True)
+            progress_callback = (
+                progress_window.update_status if progress_window else None
+            )
+            success = shutdown.execute(
+                expedited=True, progress_callback=progress_callback
+            )
 
             if success:
                 logger.info("Audio PC shutdown completed successfully")
-                if progress_window:
-                    progress_window.update_status("PC de áudio desligado!")
                 return True
 
-            # If first attempt failed, wait and verify shutdown
-            if progress_window:
-                progress_window.update_status(
-                    "Aguardando confirmação de desligamento..."
-                )
-
-            while time.time() - start_time < MAX_TIMEOUT:
-                time.sleep(2)
-
-                status = checker.get_status(
-                    self.config.audio_pc.ip_address,
-                    ports=self.config.network.check_ports,
-                    ping_timeout=2000,
-                )
-
-                if not status.is_online:
-                    logger.info("Audio PC confirmed offline")
-                    if progress_window:
-                        progress_window.update_status("PC de áudio confirmado offline")
-                    return True
-
             logger.warning(
-                f"Audio PC shutdown timeout after {MAX_TIMEOUT}s, "
-                "allowing system shutdown anyway"
+                "Audio PC shutdown not confirmed, allowing system shutdown anyway"
             )
             if progress_window:
                 progress_window.update_status("Timeout - permitindo desligamento")
@@ -8,20 +8,50 @@ methods.
 
 from __future__ import annotations
 
+import contextlib
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.core import SUBPROCESS_FLAGS, logger
 from src.core.config import get_config
 from src.core.network import NetworkChecker
+from src.utils.windows import system_executable
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+    ProgressCallback = Callable[[str], None]
 
 
 class RemoteShutdown:
     """Remote shutdown manager with multiple fallback methods."""
 
+    # Longest time to wait for a group of concurrent methods (PowerShell: 15s)
+    METHOD_TIMEOUT = 20
+
+    # Shutdown confirmation polling: the interval doubles from MIN to MAX
+    # while the PC still answers, then drops to CONFIRM_INTERVAL so the
+    # consecutive offline checks finish quickly
+    POLL_INTERVAL_MIN = 0.25
+    POLL_INTERVAL_MAX = 1.0
+    CONFIRM_INTERVAL = 0.15
+    CONFIRM_PING_TIMEOUT = 500  # milliseconds
+    REQUIRED_OFFLINE_CHECKS = 3
+
+    # SMB is probed before pinging: it answers until Windows is going down.
+    # If it was seen open, one failed probe plus one missed ping confirms
+    PROBE_PORT = 445
+    PROBE_PORT_TIMEOUT = 250  # milliseconds
+
     def __init__(self, ip_address: str, username: str, password: str) -> None:
         """
         Initialize shutdown manager.
@@ -34,10 +64,94 @@ class RemoteShutdown:
         self.ip_address = ip_address
         self.username = username
         self.password = password
+        self._ps_script = self._build_powershell_script()
+        self._processes: set[subprocess.Popen] = set()
+        self._stopped = False
+        self._process_lock = threading.Lock()
+
+    def _run(
+        self,
+        command: str | list[str],
+        timeout: float,
+        input: str | None = None,
+        capture_output: bool = True,
+        **kwargs: Any,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command like subprocess.run.
+
+        The process is tracked while it runs so _stop_pending() can end it
+        once the shutdown no longer needs it. After that, no new commands
+        are started, so abandoned methods stop at their next step.
+
+        Args:
+            command: Command to run
+            timeout: Timeout in seconds
+            input: Data to write to the command's stdin
+            capture_output: If False, discard the output instead of piping
+                it back (no pipes or reader threads are set up)
+            **kwargs: Extra arguments for subprocess.Popen
+
+        Returns:
+            The completed process
+
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time
+            RuntimeError: If the shutdown attempt has already finished
+        """
+        output = subprocess.PIPE if capture_output else subprocess.DEVNULL
+        with self._process_lock:
+            if self._stopped:
+                raise RuntimeError("Shutdown attempt already finished")
+
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE if input is not None else None,
+                stdout=output,
+                stderr=output,
+                creationflags=SUBPROCESS_FLAGS,
+                **kwargs,
+            )
+            self._processes.add(process)
+
+        with process:
+            try:
+                stdout, stderr = process.communicate(input, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            finally:
+                self._processes.discard(process)
+
+        return subprocess.CompletedProcess(
+            process.args, process.returncode, stdout, stderr
+        )
+
+    def _stop_pending(self) -> None:
+        """Kill shutdown commands that are still running and block new ones."""
+        with self._process_lock:
+            self._stopped = True
+            processes = list(self._processes)
+
+        for process in processes:
+            with contextlib.suppress(OSError):
+                process.kill()
 
-    def is_online(self) -> bool:
-        """Check if the PC is online."""
-        pingable, _ = NetworkChecker.ping(self.ip_address, timeout=1000)
+    def is_online(self, timeout: int = 1000, use_cache: bool = True) -> bool:
+        """
+        Check if the PC is online.
+
+        Args:
+            timeout: Ping timeout in milliseconds
+            use_cache: If False, ignore recently cached ping results
+
+        Returns:
+            True if the PC answered the ping
+        """
+        pingable, _ = NetworkChecker.ping(
+            self.ip_address, timeout=timeout, use_cache=use_cache
+        )
         return pingable
 
     def shutdown_via_psexec(self) -> bool:
@@ -72,13 +186,8 @@ class RemoteShutdown:
                 "5",
             ]
 
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                timeout=10,
-                check=False,
-                creationflags=SUBPROCESS_FLAGS,
-            )
+            # Only the exit code matters, so the output is not captured
+            result = self._run(command, timeout=10, capture_output=False)
 
             success = result.returncode == 0
             if success:
@@ -100,36 +209,42 @@ class RemoteShutdown:
             True if successful
         """
         try:
-            import wmi
+            import pythoncom
+            import win32com.client
+        except ImportError:
+            logger.warning("WMI (pywin32 COM) not available")
+            return False
 
-            # Connect to remote PC - pass empty password for accounts without password
-            connection = wmi.WMI(
-                computer=self.ip_address,
-                user=self.username,
-                password=self.password,  # Can be empty string for passwordless accounts
+        # COM must be initialized on each thread that uses WMI
+        pythoncom.CoInitialize()
+        try:
+            # Talk to SWbemLocator directly; the wmi wrapper's class
+            # introspection is not needed for a single method call.
+            # Pass empty password for accounts without password
+            locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+            services = locator.ConnectServer(
+                self.ip_address, "root\\cimv2", self.username, self.password
             )
 
-            # Execute shutdown
-            os_list = connection.Win32_OperatingSystem()
-            for os_obj in os_list:
-                result = os_obj.Win32Shutdown(5)  # 5 = Forced shutdown
-
-                if result == 0:
-                    logger.info("Shutdown sent via WMI")
-                    return True
-                logger.warning(f"WMI returned code: {result}")
-                return False
-
-            return False
+            # There is exactly one Win32_OperatingSystem instance
+            os_obj = services.ExecQuery(
+                "SELECT * FROM Win32_OperatingSystem"
+            ).ItemIndex(0)
+            result = os_obj.Win32Shutdown(5)  # 5 = Forced shutdown
 
-        except ImportError:
-            logger.warning("WMI library not available")
+            if result == 0:
+                logger.info("Shutdown sent via WMI")
+                return True
+            logger.warning(f"WMI returned code: {result}")
             return False
 
         except Exception as e:
             logger.error(f"Error using WMI: {e}")
             return False
 
+        finally:
+            pythoncom.CoUninitialize()
+
     def shutdown_via_powershell(self) -> bool:
         """
         Shutdown using PowerShell Remoting.
@@ -140,25 +255,20 @@ class RemoteShutdown:
             True if successful
         """
         try:
-            # PowerShell script - supports empty password for accounts without password
-            # Convert empty string to secure string works for passwordless accounts
-            ps_script = f"""
-            $password = ConvertTo-SecureString '{self.password}' -AsPlainText -Force
-            $credential = New-Object System.Management.Automation.PSCredential('{self.username}', $password)
-
-            Invoke-Command -ComputerName {self.ip_address} -Credential $credential -ScriptBlock {{
-                Stop-Computer -Force
-            }} -ErrorAction Stop
-            """
-
-            # Execute PowerShell
-            result = subprocess.run(
-                ["powershell", "-Command", ps_script],
-                capture_output=True,
+            # The script is read from stdin, keeping credentials off the command line
+            result = self._run(
+                [
+                    system_executable("powershell"),
+                    "-NoProfile",
+                    "-NonInteractive",
+                    "-ExecutionPolicy",
+                    "Bypass",
+                    "-Command",
+                    "-",
+                ],
                 timeout=15,
+                input=self._ps_script,
                 text=True,
-                check=False,
-                creationflags=SUBPROCESS_FLAGS,
             )
 
             success = result.returncode == 0
@@ -173,6 +283,33 @@ class RemoteShutdown:
             logger.error(f"Error using PowerShell: {e}")
             return False
 
+    def _build_powershell_script(self) -> str:
+        """
+        Build the PowerShell Remoting shutdown script.
+
+        Scripts read from stdin run line by line, so everything is kept on a
+        single line and failures are turned into a non-zero exit code.
+
+        Returns:
+            Script text ready to be written to PowerShell's stdin
+        """
+
+        def quote(value: str) -> str:
+            return "'" + value.replace("'", "''") + "'"
+
+        # Supports empty password for accounts without password
+        return (
+            "try { "
+            f"$password = ConvertTo-SecureString {quote(self.password)} "
+            "-AsPlainText -Force; "
+            "$credential = New-Object System.Management.Automation.PSCredential("
+            f"{quote(self.username)}, $password); "
+            f"Invoke-Command -ComputerName {quote(self.ip_address)} "
+            "-Credential $credential -ScriptBlock { Stop-Computer -Force } "
+            "-ErrorAction Stop "
+            "} catch { [Console]::Error.WriteLine($_); exit 1 }\n"
+        )
+
     def shutdown_via_net(self) -> bool:
         """
         Shutdown using 'net' and 'shutdown' commands.
@@ -183,50 +320,49 @@ class RemoteShutdown:
             True if successful
         """
         try:
-            # Establish IPC connection
-            # For accounts without password, use "" or omit password
-            if self.password:
-                net_use = f"net use \\\\{self.ip_address}\\IPC$ /user:{self.username} {self.password}"
-            else:
-                # Use empty password for accounts without password
-                net_use = (
-                    f'net use \\\\{self.ip_address}\\IPC$ /user:{self.username} ""'
-                )
-
-            subprocess.run(
-                net_use,
-                shell=True,
-                capture_output=True,
+            ipc_share = f"\\\\{self.ip_address}\\IPC$"
+
+            # Commands run directly (no cmd.exe), so credentials need no shell
+            # quoting; an empty password is passed to net as ""
+            self._run(
+                [
+                    system_executable("net"),
+                    "use",
+                    ipc_share,
+                    f"/user:{self.username}",
+                    self.password,
+                ],
                 timeout=5,
-                check=False,
-                creationflags=SUBPROCESS_FLAGS,
+                capture_output=False,
             )
 
-            # Send shutdown
-            shutdown_cmd = f"shutdown /s /f /m \\\\{self.ip_address} /t 5"
-            result = subprocess.run(
-                shutdown_cmd,
-                shell=True,
-                capture_output=True,
-                timeout=5,
-                text=True,
-                check=False,
-                creationflags=SUBPROCESS_FLAGS,
-            )
-
-            # Clean up connection
-            time.sleep(1)
-            subprocess.run(
-                f"net use \\\\{self.ip_address}\\IPC$ /delete /yes",
-                shell=True,
-                capture_output=True,
-                check=False,
-                creationflags=SUBPROCESS_FLAGS,
-            )
+            try:
+                result = self._run(
+                    [
+                        system_executable("shutdown"),
+                        "/s",
+                        "/f",
+                        "/m",
+                        f"\\\\{self.ip_address}",
+                        "/t",
+                        "5",
+                    ],
+                    timeout=5,
+                    text=True,
+                )
+            finally:
+                # Clean up connection
+                self._run(
+                    [system_executable("net"), "use", ipc_share, "/delete", "/yes"],
+                    timeout=5,
+                    capture_output=False,
+                )
 
             success = result.returncode == 0
             if success:
                 logger.info("Shutdown sent via net/shutdown")
+            else:
+                logger.warning("net/shutdown failed: %s", result.stderr.strip())
 
             return success
 
@@ -234,25 +370,37 @@ class RemoteShutdown:
             logger.error(f"Error using net/shutdown: {e}")
             return False
 
-    def execute(self, expedited: bool = False) -> bool:
+    def execute(
+        self,
+        expedited: bool = False,
+        progress_callback: ProgressCallback | None = None,
+    ) -> bool:
         """
         Execute shutdown with optional expedited mode.
 
         Args:
             expedited: If True, use shorter timeouts for faster shutdown
+            progress_callback: Callback to report status messages
 
         Returns:
             True if successful
         """
-        success, _ = self.shutdown(expedited=expedited)
+        success, _ = self.shutdown(
+            expedited=expedited, progress_callback=progress_callback
+        )
         return success
 
-    def shutdown(self, expedited: bool = False) -> tuple[bool, str]:
+    def shutdown(
+        self,
+        expedited: bool = False,
+        progress_callback: ProgressCallback | None = None,
+    ) -> tuple[bool, str]:
         """
         Attempt to shutdown the PC using multiple methods.
 
         Args:
             expedited: If True, use shorter timeouts (for system shutdown blocking)
+            progress_callback: Callback to report status messages
 
         Returns:
             Tuple of (success, message)
@@ -263,50 +411,109 @@ class RemoteShutdown:
         logger.info("=" * 50)
 
         # Check if already offline
+        if progress_callback:
+            progress_callback("Verificando status do PC de áudio...")
+
         if not self.is_online():
             message = "PC de Áudio já está offline"
             logger.info(message)
+            if progress_callback:
+                progress_callback(message)
             return True, message
 
-        # Methods in order of preference
-        methods = [
-            ("PowerShell Remoting", self.shutdown_via_powershell),
-            ("WMI", self.shutdown_via_wmi),
-            ("Net/Shutdown", self.shutdown_via_net),
-            ("PsExec", self.shutdown_via_psexec),
+        # The first group uses independent transports and runs concurrently,
+        # so the total time is the slowest method rather than the sum of all.
+        # PsExec is only tried if none of them worked.
+        stages = [
+            [
+                ("PowerShell Remoting", self.shutdown_via_powershell),
+                ("WMI", self.shutdown_via_wmi),
+                ("Net/Shutdown", self.shutdown_via_net),
+            ],
+            [("PsExec", self.shutdown_via_psexec)],
         ]
 
         # Adjust wait time based on mode
         max_wait = 30 if expedited else 60
 
-        for method_name, method_func in methods:
-            logger.info(f"Trying method: {method_name}")
-
-            try:
-                if method_func():
-                    # Wait for confirmation
-                    time.sleep(2 if expedited else 3)
-
-                    if self._wait_for_shutdown(max_wait=max_wait):
-                        message = f"PC de Áudio desligado via {method_name}"
-                        logger.info(f"SUCCESS: {message}")
-                        return True, message
-                    logger.warning("Command sent but PC still online")
-
-            except Exception as e:
-                logger.error(f"Error in method {method_name}: {e}")
+        try:
+            for methods in stages:
+                if progress_callback:
+                    progress_callback("Enviando comando de desligamento...")
+
+                method_name = self._send_first(methods)
+                if method_name is None:
+                    continue
+
+                # Wait for confirmation
+                time.sleep(2 if expedited else 3)
+
+                if self._wait_for_shutdown(
+                    max_wait=max_wait, progress_callback=progress_callback
+                ):
+                    message = f"PC de Áudio desligado via {method_name}"
+                    logger.info("SUCCESS: %s", message)
+                    if progress_callback:
+                        progress_callback(message)
+                    return True, message
+                logger.warning("Command sent but PC still online")
+
+        finally:
+            # Methods that lost the race may still be running; once the
+            # outcome is known they only delay the exit
+            self._stop_pending()
 
         # Failed all methods
         message = "Não foi possível desligar PC de Áudio"
         logger.error(message)
         return False, message
 
-    def _wait_for_shutdown(self, max_wait: int = 60) -> bool:
+    def _send_first(
+        self, methods: Sequence[tuple[str, Callable[[], bool]]]
+    ) -> str | None:
+        """
+        Run shutdown methods concurrently.
+
+        Args:
+            methods: (name, function) pairs to run
+
+        Returns:
+            Name of the first method that succeeded, or None if all failed
+        """
+        logger.info("Trying methods: %s", ", ".join(name for name, _ in methods))
+
+        pool = ThreadPoolExecutor(
+            max_workers=len(methods), thread_name_prefix="shutdown"
+        )
+        futures = {pool.submit(func): name for name, func in methods}
+
+        try:
+            for future in as_completed(futures, timeout=self.METHOD_TIMEOUT):
+                method_name = futures[future]
+                try:
+                    if future.result():
+                        return method_name
+                except Exception as e:
+                    logger.error("Error in method %s: %s", method_name, e)
+        except TimeoutError:
+            logger.warning("Shutdown methods timed out after %ds", self.METHOD_TIMEOUT)
+        finally:
+            # Commands already running cannot be stopped; don't wait for them
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return None
+
+    def _wait_for_shutdown(
+        self,
+        max_wait: int = 60,
+        progress_callback: ProgressCallback | None = None,
+    ) -> bool:
         """
         Wait for shutdown confirmation.
 
         Args:
             max_wait: Maximum wait time in seconds
+            progress_callback: Callback to report status messages
 
         Returns:
             True if PC shutdown confirmed
@@ -314,26 +521,50 @@ class RemoteShutdown:
         logger.info("Waiting for shutdown confirmation...")
 
         consecutive_offline = 0
-        required_checks = 3
-
-        for _i in range(max_wait):
-            time.sleep(1)
+        required_checks = self.REQUIRED_OFFLINE_CHECKS
+        interval = self.POLL_INTERVAL_MIN
+        start = time.monotonic()
+        deadline = start + max_wait
+
+        while time.monotonic() < deadline:
+            time.sleep(interval)
+
+            if progress_callback:
+                elapsed = time.monotonic() - start
+                progress_callback(
+                    "Aguardando confirmação de desligamento... "
+                    f"({elapsed:.0f}/{max_wait}s)"
+                )
 
-            if not self.is_online():
-                consecutive_offline += 1
-                logger.debug(f"Offline check {consecutive_offline}/{required_checks}")
+            if NetworkChecker.check_port(
+                self.ip_address, self.PROBE_PORT, timeout=self.PROBE_PORT_TIMEOUT
+            ):
+                required_checks = 1
+                consecutive_offline = 0
+                interval = min(interval * 2, self.POLL_INTERVAL_MAX)
+                continue
 
-                if consecutive_offline >= required_checks:
-                    logger.info("PC confirmed offline")
-                    return True
-            else:
+            # Each check must be a new ping, not the cached previous answer
+            if self.is_online(timeout=self.CONFIRM_PING_TIMEOUT, use_cache=False):
                 consecutive_offline = 0
+                interval = min(interval * 2, self.POLL_INTERVAL_MAX)
+                continue
+
+            consecutive_offline += 1
+            logger.debug("Offline check %d/%d", consecutive_offline, required_checks)
+
+            if consecutive_offline >= required_checks:
+                logger.info("PC confirmed offline")
+                return True
+            interval = self.CONFIRM_INTERVAL
 
         logger.warning(f"Timeout after {max_wait}s")
         return False
 
-    def _find_psexec(self) -> str | None:
-        """Find PsExec.exe in the system."""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _find_psexec() -> str | None:
+        """Find PsExec.exe in the system (resolved once per process)."""
         # Search in PATH
         psexec = shutil.which("psexec.exe")
         if psexec:
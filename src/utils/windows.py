@@ -7,13 +7,80 @@ for automatic execution of the synchronization system.
 
 from __future__ import annotations
 
+import contextlib
+import ctypes
+import os
 import subprocess
+import sys
+import threading
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.core import SUBPROCESS_FLAGS, logger
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
 _mutex = None
 
+_TASK_NAME = "ChurchStreamSync"
+_TASK_CREATE_OR_UPDATE = 6
+_TASK_LOGON_INTERACTIVE_TOKEN = 3
+_RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+# Same definition the ScheduledTasks PowerShell cmdlets used to register:
+# at logon of the current user, interactive, highest privileges, and
+# allowed to start on batteries or late (StartWhenAvailable)
+_STARTUP_TASK_XML = """\
+<?xml version="1.0" encoding="UTF-16"?>
+<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <Triggers>
+    <LogonTrigger>
+      <Enabled>true</Enabled>
+      <UserId>{user}</UserId>
+    </LogonTrigger>
+  </Triggers>
+  <Principals>
+    <Principal id="Author">
+      <UserId>{user}</UserId>
+      <LogonType>InteractiveToken</LogonType>
+      <RunLevel>HighestAvailable</RunLevel>
+    </Principal>
+  </Principals>
+  <Settings>
+    <MultipleInstancesPolicy>IgnoreNew</MultipleInstancesPolicy>
+    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
+    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
+    <StartWhenAvailable>true</StartWhenAvailable>
+    <ExecutionTimeLimit>PT72H</ExecutionTimeLimit>
+  </Settings>
+  <Actions Context="Author">
+    <Exec>
+      <Command>{command}</Command>
+    </Exec>
+  </Actions>
+</Task>
+"""
+
+
+@cache
+def system_executable(name: str) -> str:
+    """
+    Resolve a command-line tool to an absolute path, once per process.
+
+    Args:
+        name: Executable name (e.g. "schtasks")
+
+    Returns:
+        Absolute path, or the bare name if it is not on PATH
+    """
+    import shutil
+
+    return shutil.which(name) or name
+
 
 class WindowsTaskManager:
     """Windows Task Scheduler manager."""
@@ -23,6 +90,118 @@ class WindowsTaskManager:
         """
         Create a scheduled task to run on login.
 
+        The task definition is registered in-process through the Task
+        Scheduler COM service; schtasks.exe and then PowerShell are only
+        used if that fails.
+
+        Args:
+            exe_path: Full path to the executable
+
+        Returns:
+            Tuple of (success, message)
+        """
+        # Only the installer needs these, so keep them off the startup path
+        # (xml.sax.saxutils alone pulls in urllib and http.client)
+        import tempfile
+        from xml.sax.saxutils import escape
+
+        task_xml = _STARTUP_TASK_XML.format(
+            user=escape(os.environ.get("USERNAME", "")), command=escape(exe_path)
+        )
+
+        if WindowsTaskManager._register_task_com(task_xml):
+            logger.info("Startup task created successfully")
+            return True, "Tarefa de startup configurada"
+
+        xml_path = None
+        try:
+            # schtasks only reads task XML from a file (UTF-16 with BOM)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-16", suffix=".xml", delete=False
+            ) as xml_file:
+                xml_file.write(task_xml)
+                xml_path = xml_file.name
+
+            result = subprocess.run(
+                [
+                    system_executable("schtasks"),
+                    "/Create",
+                    "/TN",
+                    _TASK_NAME,
+                    "/XML",
+                    xml_path,
+                    "/F",
+                ],
+                capture_output=True,
+                text=True,
+                timeout=15,
+                check=False,
+                creationflags=SUBPROCESS_FLAGS,
+            )
+
+            if result.returncode == 0:
+                logger.info("Startup task created successfully")
+                return True, "Tarefa de startup configurada"
+            logger.warning(
+                "schtasks failed to create startup task, trying PowerShell: %s",
+                result.stderr.strip(),
+            )
+
+        except Exception as e:
+            logger.warning("schtasks failed to create startup task: %s", e)
+
+        finally:
+            if xml_path:
+                with contextlib.suppress(OSError):
+                    Path(xml_path).unlink()
+
+        return WindowsTaskManager._create_startup_task_powershell(exe_path)
+
+    @staticmethod
+    def _register_task_com(task_xml: str) -> bool:
+        """
+        Register the startup task with ITaskFolder.RegisterTask.
+
+        Args:
+            task_xml: Task definition XML
+
+        Returns:
+            True if the task was registered
+        """
+        try:
+            import pythoncom
+            import win32com.client
+        except ImportError:
+            return False
+
+        pythoncom.CoInitialize()
+        try:
+            service = win32com.client.Dispatch("Schedule.Service")
+            service.Connect()
+            folder = service.GetFolder("\\")
+            # Credentials come from the XML principal (interactive token)
+            folder.RegisterTask(
+                _TASK_NAME,
+                task_xml,
+                _TASK_CREATE_OR_UPDATE,
+                "",
+                "",
+                _TASK_LOGON_INTERACTIVE_TOKEN,
+            )
+            return True
+
+        except Exception as e:
+            logger.warning("Task Scheduler COM failed to create startup task: %s", e)
+            return False
+
+        finally:
+            pythoncom.CoUninitialize()
+
+    @staticmethod
+    def _create_startup_task_powershell(exe_path: str) -> tuple[bool, str]:
+        """
+        Create the startup task with the ScheduledTasks PowerShell module.
+
         Args:
             exe_path: Full path to the executable
 
@@ -44,7 +223,15 @@ Register-ScheduledTask -TaskName "ChurchStreamSync" -Action $Action -Trigger $Tr
 '''
 
             result = subprocess.run(
-                ["powershell", "-Command", ps_script],
+                [
+                    system_executable("powershell"),
+                    "-NoProfile",
+                    "-NonInteractive",
+                    "-ExecutionPolicy",
+                    "Bypass",
+                    "-Command",
+                    ps_script,
+                ],
                 capture_output=True,
                 text=True,
                 timeout=30,
@@ -71,13 +258,11 @@ Register-ScheduledTask -TaskName "ChurchStreamSync" -Action $Action -Trigger $Tr
             Tuple of (success, message)
         """
         try:
-            ps_script = """
-Unregister-ScheduledTask -TaskName "ChurchStreamSync" -Confirm:$false -ErrorAction SilentlyContinue
-"""
-
+            # A missing task is not an error, so the exit code is ignored
             subprocess.run(
-                ["powershell", "-Command", ps_script],
-                capture_output=True,
+                [system_executable("schtasks"), "/Delete", "/TN", _TASK_NAME, "/F"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=30,
                 check=False,
                 creationflags=SUBPROCESS_FLAGS,
@@ -91,33 +276,128 @@ Unregister-ScheduledTask -TaskName "ChurchStreamSync" -Confirm:$false -ErrorActi
             return False, str(e)
 
     @staticmethod
-    def check_tasks() -> dict[str, bool | str | None]:
+    def task_exists(name: str = _TASK_NAME) -> bool:
         """
-        Check status of scheduled task.
+        Check whether a scheduled task is registered.
+
+        Asks the Task Scheduler COM service in-process; schtasks.exe is only
+        started if pywin32 or the service is not available.
+
+        Args:
+            name: Task name
 
         Returns:
-            Dictionary with task status
+            True if the task exists
         """
-        status: dict[str, bool | str | None] = {
-            "startup": False,
-            "startup_details": None,
-        }
+        try:
+            import pythoncom
+            import pywintypes
+            import win32com.client
+        except ImportError:
+            return WindowsTaskManager._task_exists_schtasks(name)
+
+        pythoncom.CoInitialize()
+        try:
+            service = win32com.client.Dispatch("Schedule.Service")
+            service.Connect()
+            folder = service.GetFolder("\\")
+        except Exception as e:
+            logger.debug("Task Scheduler service not available: %s", e)
+            return WindowsTaskManager._task_exists_schtasks(name)
+        else:
+            try:
+                folder.GetTask(name)
+            except pywintypes.com_error:
+                return False
+            return True
+        finally:
+            pythoncom.CoUninitialize()
+
+    @staticmethod
+    def _task_exists_schtasks(name: str) -> bool:
+        """
+        Check whether a scheduled task is registered, using schtasks.exe.
 
+        Args:
+            name: Task name
+
+        Returns:
+            True if the task exists
+        """
+        try:
+            result = subprocess.run(
+                [system_executable("schtasks"), "/Query", "/TN", name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=15,
+                check=False,
+                creationflags=SUBPROCESS_FLAGS,
+            )
+            return result.returncode == 0
+
+        except Exception as e:
+            logger.error(f"Error checking task: {e}")
+            return False
+
+    @staticmethod
+    def task_details(name: str = _TASK_NAME) -> str | None:
+        """
+        Get the verbose schtasks listing of a scheduled task.
+
+        Args:
+            name: Task name
+
+        Returns:
+            Task details, or None if the task does not exist
+        """
         try:
             result = subprocess.run(
-                ["schtasks", "/Query", "/TN", "ChurchStreamSync", "/FO", "LIST", "/V"],
+                [
+                    system_executable("schtasks"),
+                    "/Query",
+                    "/TN",
+                    name,
+                    "/FO",
+                    "LIST",
+                    "/V",
+                ],
                 capture_output=True,
                 text=True,
+                timeout=15,
                 check=False,
                 creationflags=SUBPROCESS_FLAGS,
             )
-
             if result.returncode == 0:
-                status["startup"] = True
-                status["startup_details"] = result.stdout
+                return result.stdout
 
         except Exception as e:
-            logger.error(f"Error checking task: {e}")
+            logger.error(f"Error reading task details: {e}")
+
+        return None
+
+    @staticmethod
+    def check_tasks(include_details: bool = False) -> dict[str, bool | str | None]:
+        """
+        Check status of scheduled task.
+
+        Args:
+            include_details: Also collect the verbose task listing, which is
+                much slower to produce than an existence check
+
+        Returns:
+            Dictionary with task status
+        """
+        status: dict[str, bool | str | None] = {
+            "startup": False,
+            "startup_details": None,
+        }
+
+        if include_details:
+            details = WindowsTaskManager.task_details()
+            status["startup"] = details is not None
+            status["startup_details"] = details
+        else:
+            status["startup"] = WindowsTaskManager.task_exists()
 
         return status
 
@@ -140,12 +420,10 @@ class WindowsStartupManager:
         try:
             import winreg
 
-            key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE
-            )
-            winreg.SetValueEx(key, name, 0, winreg.REG_SZ, exe_path)
-            winreg.CloseKey(key)
+            with winreg.OpenKeyEx(
+                winreg.HKEY_CURRENT_USER, _RUN_KEY, 0, winreg.KEY_SET_VALUE
+            ) as key:
+                winreg.SetValueEx(key, name, 0, winreg.REG_SZ, exe_path)
 
             logger.info(f"Added to startup: {name}")
             return True
@@ -168,18 +446,15 @@ class WindowsStartupManager:
         try:
             import winreg
 
-            key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE
-            )
-
-            try:
-                winreg.DeleteValue(key, name)
-                logger.info(f"Removed from startup: {name}")
-            except FileNotFoundError:
-                pass
+            with winreg.OpenKeyEx(
+                winreg.HKEY_CURRENT_USER, _RUN_KEY, 0, winreg.KEY_SET_VALUE
+            ) as key:
+                try:
+                    winreg.DeleteValue(key, name)
+                    logger.info(f"Removed from startup: {name}")
+                except FileNotFoundError:
+                    pass
 
-            winreg.CloseKey(key)
             return True
 
         except Exception as e:
@@ -198,6 +473,10 @@ def ensure_single_instance() -> bool:
     """
     global _mutex
 
+    # Already holding the mutex from an earlier call
+    if _mutex is not None:
+        return True
+
     try:
         import win32api
         import win32event
@@ -208,7 +487,7 @@ def ensure_single_instance() -> bool:
 
     try:
         # Create a named mutex (None uses default security attributes)
-        _mutex = win32event.CreateMutex(None, False, "ChurchStreamSyncMutex")  # pyright: ignore [reportArgumentType]
+        mutex = win32event.CreateMutex(None, False, "ChurchStreamSyncMutex")  # pyright: ignore [reportArgumentType]
 
         # Check if mutex already exists
         last_error = win32api.GetLastError()
@@ -217,6 +496,8 @@ def ensure_single_instance() -> bool:
             logger.info("Another instance is already running")
             return False
 
+        # Keep the handle only when this process owns the name
+        _mutex = mutex
         logger.info("Single instance check passed")
         return True
 
@@ -224,3 +505,36 @@ def ensure_single_instance() -> bool:
         logger.error(f"Error checking single instance: {e}")
         # On error, allow execution to continue
         return True
+
+
+def watch_address_changes(callback: Callable[[], None]) -> bool:
+    """
+    Call a function whenever a local IPv4 address changes.
+
+    A daemon thread blocks in NotifyAddrChange (iphlpapi), so there is no
+    polling; the callback runs on that thread.
+
+    Args:
+        callback: Function to call after each change
+
+    Returns:
+        True if the watcher was started
+    """
+    if sys.platform != "win32":
+        return False
+
+    try:
+        notify_addr_change = ctypes.windll.iphlpapi.NotifyAddrChange
+    except (AttributeError, OSError) as e:
+        logger.warning(f"Network change notifications not available: {e}")
+        return False
+
+    def watch() -> None:
+        # Without handle/overlapped arguments the call blocks until a change
+        while notify_addr_change(None, None) == 0:
+            logger.debug("Local network address changed")
+            callback()
+        logger.warning("Network change notifications stopped")
+
+    threading.Thread(target=watch, name="addr-change", daemon=True).start()
+    return True